@@ -0,0 +1,108 @@
+import asyncio
+from typing import Any, Callable
+from langchain_core.runnables import RunnableLambda
+from tools.clock import today_str
+from agents._llm import astream_text, stream_text
+from tools.file_cache import FileCache
+from tools.format import format_box
+
+
+def make_llm_agent(
+    *,
+    name: str,
+    emoji: str,
+    date_emoji: str = "📅",
+    title: str,
+    report_key: str,
+    fetch_fn: Callable[[str, dict], Any],
+    prompt_fn: Callable[[str, Any], Any],
+    is_empty: Callable[[Any], bool] = lambda raw: not raw,
+    empty_text: str = "(No data available for {symbol}.)",
+    date_fn: Callable[[Any], str] | None = None,
+    cache_ttl: float | None = None,
+) -> RunnableLambda:
+    """
+    Build a single-prompt analyst node: fetch data -> build prompt -> Gemini -> boxed report.
+
+    Args:
+        name (str): Log label, e.g. "Fundamental Analysis Agent".
+        emoji (str): Prefix for log lines and the report title.
+        date_emoji (str): Prefix for the report's date line.
+        title (str): Report title, rendered as "<emoji> <title> for <symbol>".
+        report_key (str): State key the report is written to.
+        fetch_fn (callable): (symbol, state) -> raw data. May block; the async
+            path runs it (and prompt_fn) in a worker thread.
+        prompt_fn (callable): (symbol, raw) -> LLM input (prompt string or message list).
+        is_empty (callable): raw -> True when there is nothing to analyze;
+            the LLM call is skipped and `empty_text` becomes the report body.
+        empty_text (str): Body for empty data, formatted with `symbol`.
+        date_fn (callable): raw -> report date; defaults to today's date.
+        cache_ttl (float): Seconds to reuse the LLM analysis for an identical prompt
+            (same data, same day), on disk under .cache/agents/<report_key>.
+            None disables caching.
+
+    Returns:
+        RunnableLambda (sync + async) mapping state -> {"symbol": ..., report_key: report}.
+    """
+
+    cache = FileCache(f"agents/{report_key}", ttl=cache_ttl) if cache_ttl else None
+
+    def _prepare(state: dict):
+        symbol = state["symbol"]
+        print("-" * 60)
+        print(f"{emoji} [{name}] Fetching data for {symbol}...")
+
+        raw = fetch_fn(symbol, state)
+        today = date_fn(raw) if date_fn else today_str()
+
+        if is_empty(raw):
+            print(f"⚠️ [{name}] No data found; skipping LLM call.")
+            return symbol, today, None, None, None
+
+        prompt = prompt_fn(symbol, raw)
+        key = cache.make_key(prompt) if cache else None
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            print(f"♻️ [{name}] Same data as a recent run; reusing its analysis.")
+        else:
+            print(f"🤖 [{name}] Analyzing with LLM...")
+        return symbol, today, prompt, key, cached
+
+    def _store(key: str | None, insights: str) -> str:
+        if key and insights:
+            cache.set(key, insights)
+        return insights
+
+    def _report(symbol: str, today: str, insights: str | None) -> dict:
+        if insights is not None:
+            print(f"✅ [{name}] Analysis complete.")
+        print("-" * 60 + "\n")
+
+        report_header = format_box((
+            f"{emoji} {title} for {symbol}",
+            f"{date_emoji} Date: {today}"
+        ), width=90)
+
+        body = insights if insights is not None else empty_text.format(symbol=symbol)
+        full_report = f"{report_header}\n{body}\n"
+        print(full_report)
+
+        return {
+            "symbol": symbol,
+            report_key: full_report
+        }
+
+    def _invoke(state: dict) -> dict:
+        symbol, today, prompt, key, insights = _prepare(state)
+        if prompt and insights is None:
+            insights = _store(key, stream_text(prompt))
+        return _report(symbol, today, insights)
+
+    async def _ainvoke(state: dict) -> dict:
+        # Data fetches (and cache reads) are blocking; keep them off the event loop
+        symbol, today, prompt, key, insights = await asyncio.to_thread(_prepare, state)
+        if prompt and insights is None:
+            insights = _store(key, await astream_text(prompt))
+        return _report(symbol, today, insights)
+
+    return RunnableLambda(_invoke, afunc=_ainvoke)
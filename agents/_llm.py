@@ -0,0 +1,65 @@
+from functools import lru_cache
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=1)
+def get_llm():
+    """
+    Shared Gemini client for all agents.
+    Built once per process (on first use) so every agent reuses the same
+    connection pool and auth state, and importing an agent stays cheap.
+    """
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    # GOOGLE_API_KEY may only be in .env; don't rely on the entry point having loaded it
+    load_dotenv()
+    return ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0)
+
+
+def _chunk_text(chunk) -> str:
+    """
+    Text of one streamed message chunk. `.content` is a str, or (for multi-part
+    replies) a list of strings / {"type": "text", "text": ...} blocks.
+    Read it directly: `.text` is a method on langchain-core 0.3 but a property on 1.x.
+    """
+    content = chunk.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        part if isinstance(part, str) else part.get("text", "")
+        for part in content
+        if isinstance(part, str) or part.get("type") == "text"
+    )
+
+
+def stream_text(llm_input, echo: bool = False) -> str:
+    """
+    Stream a completion from the shared model and return the full, stripped text.
+    With echo=True each token is printed as it arrives; only do that from a node
+    that runs alone (parallel analysts would interleave their output).
+    """
+    chunks = []
+    for chunk in get_llm().stream(llm_input):
+        text = _chunk_text(chunk)
+        chunks.append(text)
+        if echo:
+            print(text, end="", flush=True)
+    if echo:
+        print()
+    return "".join(chunks).strip()
+
+
+async def astream_text(llm_input, echo: bool = False) -> str:
+    """
+    Async twin of stream_text(): tokens are awaited on the event loop
+    instead of blocking a worker thread for the whole completion.
+    """
+    chunks = []
+    async for chunk in get_llm().astream(llm_input):
+        text = _chunk_text(chunk)
+        chunks.append(text)
+        if echo:
+            print(text, end="", flush=True)
+    if echo:
+        print()
+    return "".join(chunks).strip()
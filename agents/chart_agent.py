@@ -1,92 +1,89 @@
 import base64
-import yfinance as yf
+import io
+from concurrent.futures import ThreadPoolExecutor
 from langchain_core.runnables import RunnableLambda
 from langchain_core.messages import HumanMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-from tools.format import format_box
-from tools.yahoo_finance import extract_insider_transactions, extract_quarterly_earnings
-from tools.finance_visualizer import FinanceVisualizer
-
-llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0)
-
-
-def _encode_image(path: str) -> str:
-    """Encode local image file to base64 data URI string for Gemini."""
-    with open(path, "rb") as f:
-        b64 = base64.b64encode(f.read()).decode("utf-8")
+from agents._base import make_llm_agent
+
+
+def _encode_figure(fig) -> str | None:
+    """Render a chart Figure to an in-memory PNG and return a base64 data URI for Gemini."""
+    if fig is None:
+        return None
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=90, bbox_inches="tight")
+    fig.clear()
+    # The base64 alphabet is pure ASCII
+    b64 = base64.b64encode(buf.getvalue()).decode("ascii")
     return f"data:image/png;base64,{b64}"
 
 
-def chart_agent() -> RunnableLambda:
+def render_charts(symbol: str, stock) -> list[str]:
     """
-    Chart Analysis Agent:
-    Generates financial charts (price+insiders, revenue vs income, relative performance),
-    sends images + text context to Gemini for analysis,
-    then deletes images.
+    Draw the three analysis charts for `symbol` from an existing yf.Ticker and
+    return them as PNG data URIs (charts with no data to draw are skipped).
     """
+    from tools.yahoo_finance import extract_insider_transactions, extract_quarterly_earnings
+    from tools.finance_visualizer import FinanceVisualizer
 
-    def _invoke(state: dict) -> dict:
-        symbol = state["symbol"]
-        print("-" * 60)
-        print(f"🖼️ [Chart Agent] Generating charts for {symbol}...")
-
-        viz = FinanceVisualizer()
-        stock = yf.Ticker(symbol)
+    viz = FinanceVisualizer()
+    insiders, _ = extract_insider_transactions(stock, last_n=30) or (None, None)
+    qdf = extract_quarterly_earnings(stock, max_quarters=8)
 
+    # Draw + encode all three charts concurrently (each does its own I/O + rendering)
+    with ThreadPoolExecutor(max_workers=3) as pool:
         # 1. Insider overlay chart
-        insiders, _ = extract_insider_transactions(stock, last_n=30) or (None, None)
-        img1 = viz.draw_price_with_insiders(symbol, insiders)
-
+        f1 = pool.submit(lambda: _encode_figure(viz.draw_price_with_insiders(symbol, insiders)))
         # 2. Quarterly revenue vs net income
-        qdf = extract_quarterly_earnings(stock, max_quarters=8)
-        img2 = viz.draw_quarterly_revenue_income(symbol, qdf)
-
+        f2 = pool.submit(lambda: _encode_figure(viz.draw_quarterly_revenue_income(symbol, qdf)))
         # 3. Relative performance vs SPY
-        img3 = viz.draw_relative_performance(symbol, benchmark="SPY")
+        f3 = pool.submit(lambda: _encode_figure(viz.draw_relative_performance(symbol, benchmark="SPY")))
+        return [uri for uri in (f1.result(), f2.result(), f3.result()) if uri]
 
-        print("📈 [Chart Agent] Charts generated successfully.")
 
-        # Build multimodal input
-        img_summary = (
-            f"Generated 3 charts for {symbol}:\n"
-            f"1. Price trend with insider buy/sell markers.\n"
-            f"2. Quarterly revenue vs. net income (last 8 quarters).\n"
-            f"3. Relative performance compared to SPY (last 1 year).\n"
-            "Please analyze these visuals in a 3–5 point summary. "
-            "Focus on insider timing, financial momentum, and market performance."
-        )
+def build_chart_prompt(symbol: str) -> str:
+    """Text part of the multimodal chart-analysis request (images are attached separately)."""
+    return (
+        f"Generated 3 charts for {symbol}:\n"
+        f"1. Price trend with insider buy/sell markers.\n"
+        f"2. Quarterly revenue vs. net income (last 8 quarters).\n"
+        f"3. Relative performance compared to SPY (last 1 year).\n"
+        "Please analyze these visuals in a 3–5 point summary. "
+        "Focus on insider timing, financial momentum, and market performance."
+    )
 
-        # Attach text + images
-        message = HumanMessage(
-            content=[
-                {"type": "text", "text": img_summary},
-                {"type": "image_url", "image_url": {"url": _encode_image(img1)}},
-                {"type": "image_url", "image_url": {"url": _encode_image(img2)}},
-                {"type": "image_url", "image_url": {"url": _encode_image(img3)}},
-            ]
-        )
 
-        print("🤖 [Chart Agent] Sending charts to Gemini 2.5 Flash for analysis...")
-        insights = llm.invoke([message]).content.strip()
-        print("✅ [Chart Agent] Analysis complete.")
+def _fetch_ticker(symbol: str, state: dict):
+    # Heavy deps (yfinance, pandas, matplotlib) load on first use, not at import
+    from tools.yahoo_finance import get_ticker
 
-        # Cleanup images
-        viz.clear_images(pattern=f"{symbol}_*.png")
-        print("🗑️ [Chart Agent] Temporary chart images deleted.")
-        print("-" * 60 + "\n")
+    # Reuse the prefetched Ticker so its already-loaded data isn't fetched again
+    return (state.get("yf_cache") or {}).get("ticker") or get_ticker(symbol)
 
-        # Format report
-        report_header = format_box([
-            f"🖼️ Chart Analysis Report for {symbol}",
-            f"📅 Date: today"
-        ], width=90)
 
-        full_report = f"{report_header}\n{insights}\n"
-        print(full_report)
+def _chart_message(symbol: str, stock) -> list:
+    """Render the charts and attach them, with the text prompt, to one multimodal message."""
+    images = render_charts(symbol, stock)
+    return [HumanMessage(
+        content=[{"type": "text", "text": build_chart_prompt(symbol)}]
+        + [{"type": "image_url", "image_url": {"url": uri}} for uri in images]
+    )]
 
-        return {
-            "symbol": symbol,
-            "chart_report": full_report
-        }
 
-    return RunnableLambda(_invoke)
+def chart_agent() -> RunnableLambda:
+    """
+    Chart Analysis Agent:
+    Generates financial charts (price+insiders, revenue vs income, relative performance),
+    and sends the in-memory images + text context to Gemini for analysis
+    (nothing is written to disk).
+    """
+    return make_llm_agent(
+        name="Chart Agent",
+        emoji="🖼️",
+        title="Chart Analysis Report",
+        report_key="chart_report",
+        fetch_fn=_fetch_ticker,
+        prompt_fn=_chart_message,
+        is_empty=lambda stock: False,
+        cache_ttl=24 * 3600,
+    )
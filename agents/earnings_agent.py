@@ -1,62 +1,54 @@
 from langchain_core.runnables import RunnableLambda
-from langchain_google_genai import ChatGoogleGenerativeAI
-from tools.yahoo_finance import get_quarterly_earnings_json
-from tools.format import format_box
+from agents._base import make_llm_agent
 
-llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0)
+# Row template, parsed once and bound at import
+_quarter_line = "{}: Rev={} Net={} EPS={} (Rev QoQ={}, YoY={})".format
 
 
-def quarterly_earnings_agent() -> RunnableLambda:
-    """
-    Quarterly Earnings Analysis Agent:
-    Fetches last 4 quarters of earnings and growth,
-    then uses LLM to generate insights on trends and valuation.
-    """
+def build_earnings_prompt(symbol: str, raw: dict) -> str:
+    """Build the earnings-trend prompt from get_quarterly_earnings_json() output."""
+    today = raw["as_of"]
 
-    def _invoke(state: dict) -> dict:
-        symbol = state["symbol"]
-        print("-" * 60)
-        print(f"📑 [Quarterly Earnings Agent] Fetching quarterly earnings for {symbol}...")
-
-        raw = get_quarterly_earnings_json(symbol, max_quarters=8)
-        today = raw["as_of"]
-
-        print("📈 [Quarterly Earnings Agent] Preparing data for LLM analysis...")
-
-        # Prepare a compact table for LLM
-        q_lines = []
-        for q in raw.get("quarters", []):
-            q_lines.append(
-                f"{q['period']}: Rev={q.get('revenue')} "
-                f"Net={q.get('net_income')} EPS={q.get('eps_diluted')} "
-                f"(Rev QoQ={q['growth']['revenue'].get('qoq')}, YoY={q['growth']['revenue'].get('yoy')})"
-            )
-        q_preview = "\n".join(q_lines) if q_lines else "(No quarterly data found.)"
-
-        prompt = (
-            f"You are an equity analyst preparing an earnings trend analysis.\n"
-            f"Today is {today}. Review the last 4 quarters of results for stock ticker {symbol}:\n\n"
-            f"{q_preview}\n\n"
-            "Provide a 3–5 point analysis of the company’s recent performance. "
-            "Focus on revenue growth, profitability, EPS trends, and whether earnings momentum is strengthening or weakening."
+    # Prepare a compact table for LLM (one bound template call per quarter)
+    q_preview = "\n".join(
+        _quarter_line(
+            q["period"], q.get("revenue"), q.get("net_income"), q.get("eps_diluted"),
+            q["growth"]["revenue"].get("qoq"), q["growth"]["revenue"].get("yoy"),
         )
+        for q in raw.get("quarters", [])
+    ) or "(No quarterly data found.)"
+
+    return (
+        f"You are an equity analyst preparing an earnings trend analysis.\n"
+        f"Today is {today}. Review the last 4 quarters of results for stock ticker {symbol}:\n\n"
+        f"{q_preview}\n\n"
+        "Provide a 3–5 point analysis of the company’s recent performance. "
+        "Focus on revenue growth, profitability, EPS trends, and whether earnings momentum is strengthening or weakening."
+    )
 
-        print("🤖 [Quarterly Earnings Agent] Analyzing earnings with LLM...")
-        insights = llm.invoke(prompt).content.strip()
-        print("✅ [Quarterly Earnings Agent] Quarterly earnings analysis complete.")
-        print("-" * 60 + "\n")
 
-        report_header = format_box([
-            f"📑 Quarterly Earnings Report for {symbol}",
-            f"📅 Date: {today}"
-        ], width=90)
+def _fetch_quarterly(symbol: str, state: dict) -> dict:
+    from tools.yahoo_finance import get_quarterly_earnings_json
 
-        full_report = f"{report_header}\n{insights}\n"
-        print(full_report)
+    # Prefer the per-run prefetch; fall back to a direct fetch when run standalone
+    return (state.get("yf_cache") or {}).get("quarterly") or get_quarterly_earnings_json(symbol, max_quarters=8)
 
-        return {
-            "symbol": symbol,
-            "earnings_report": full_report
-        }
 
-    return RunnableLambda(_invoke)
+def quarterly_earnings_agent() -> RunnableLambda:
+    """
+    Quarterly Earnings Analysis Agent:
+    Fetches last 4 quarters of earnings and growth,
+    then uses LLM to generate insights on trends and valuation.
+    """
+    return make_llm_agent(
+        name="Quarterly Earnings Agent",
+        emoji="📑",
+        title="Quarterly Earnings Report",
+        report_key="earnings_report",
+        fetch_fn=_fetch_quarterly,
+        prompt_fn=build_earnings_prompt,
+        is_empty=lambda raw: not raw.get("quarters"),
+        empty_text="(No quarterly data available for {symbol}.)",
+        date_fn=lambda raw: raw["as_of"],
+        cache_ttl=24 * 3600,
+    )
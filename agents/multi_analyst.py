@@ -0,0 +1,143 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from langchain_core.runnables import RunnableLambda
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import HumanMessage
+from langchain_core.output_parsers import JsonOutputParser
+from pydantic import BaseModel, Field
+from agents._llm import get_llm
+from agents.fundamental_agent import build_fundamental_prompt
+from agents.earnings_agent import build_earnings_prompt
+from agents.insider_transaction_agent import build_insider_prompt
+from agents.chart_agent import build_chart_prompt, render_charts
+from agents.news_agent import build_news_prompt
+from agents.sentiment_agent import build_sentiment_prompt, subreddits
+from tools.format import format_box
+
+
+class AnalystReports(BaseModel):
+    """One field per analyst; each holds that analyst's numbered-list analysis."""
+    fundamental: str = Field(description="Answer to the 'fundamental' section")
+    earnings: str = Field(description="Answer to the 'earnings' section")
+    insider: str = Field(description="Answer to the 'insider' section")
+    chart: str = Field(description="Answer to the 'chart' section (uses the attached images)")
+    news: str = Field(description="Answer to the 'news' section")
+    sentiment: str = Field(description="Answer to the 'sentiment' section")
+
+
+# section -> (state key, report title, date-line emoji), matching each standalone agent's header
+SECTIONS = {
+    "fundamental": ("fundamental_report", "📊 Fundamental Analysis Report", "📅"),
+    "earnings": ("earnings_report", "📑 Quarterly Earnings Report", "📅"),
+    "insider": ("insider_report", "🕵️ Insider Transaction Report", "📅"),
+    "chart": ("chart_report", "🖼️ Chart Analysis Report", "📅"),
+    "news": ("news_report", "📰 News Summary Report", "📅"),
+    "sentiment": ("sentiment_report", "🧠 Reddit Sentiment Report", "🗓️"),
+}
+
+
+def multi_analyst_agent() -> RunnableLambda:
+    """
+    Batched Analyst Agent:
+    Runs the fundamental, earnings, insider, chart, news and sentiment analyses
+    in ONE multimodal Gemini request. Each analyst's usual prompt becomes a labeled
+    section, the model answers with a JSON object keyed by section, and the fields
+    are fanned back out into the usual per-agent report keys.
+
+    Returns:
+        RunnableLambda accepting a state dict with "symbol" (and optionally "yf_cache"),
+        returns "symbol" plus the six "<analyst>_report" keys read by the strategist.
+    """
+    parser = JsonOutputParser(pydantic_object=AnalystReports)
+
+    def _prepare(state: dict):
+        """Blocking half: fetch every analyst's data and build the one multimodal message."""
+        from tools.yahoo_finance import (
+            get_fundamentals, get_insider_transactions_json, get_quarterly_earnings_json, get_ticker
+        )
+        from tools.news_scraper import fetch_news_articles
+        from tools.reddit_scraper import search_posts_by_ticker
+
+        symbol = state["symbol"]
+        print("-" * 60)
+        print(f"🧩 [Batched Analyst Agent] Collecting data for {symbol}...")
+
+        # Prefer the per-run prefetch; fall back to direct fetches when run standalone
+        cache = state.get("yf_cache") or {}
+        stock = cache.get("ticker") or get_ticker(symbol)
+
+        # News, Reddit and chart rendering are independent round-trips; overlap them
+        # with the (usually prefetched) Yahoo data instead of paying their latencies in sequence
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            f_articles = pool.submit(fetch_news_articles, symbol, max_articles=5, days_ago=7)
+            f_posts = pool.submit(search_posts_by_ticker, subreddits=subreddits, ticker=symbol,
+                                  days_back=90, limit=100)
+            f_images = pool.submit(render_charts, symbol, stock)
+            fundamentals = cache.get("fundamentals") or get_fundamentals(symbol, stock=stock)
+            quarterly = cache.get("quarterly") or get_quarterly_earnings_json(symbol, max_quarters=8, stock=stock)
+            insiders = cache.get("insiders") or get_insider_transactions_json(symbol, last_n=15, stock=stock)
+            articles, posts, images = f_articles.result(), f_posts.result(), f_images.result()
+        today = fundamentals["date"]
+
+        prompts = {
+            "fundamental": build_fundamental_prompt(symbol, fundamentals),
+            "earnings": build_earnings_prompt(symbol, quarterly),
+            "insider": build_insider_prompt(symbol, insiders),
+            "chart": build_chart_prompt(symbol),
+            "news": build_news_prompt(symbol, articles) if articles
+                    else f"No recent news articles were found for {symbol}; say so in one sentence.",
+            "sentiment": build_sentiment_prompt(symbol, posts) if posts
+                         else f"No recent Reddit posts were found for {symbol}; say so in one sentence.",
+        }
+        combined = "\n\n".join(f"### Section: {name}\n{text}" for name, text in prompts.items())
+        instructions = (
+            "You are a team of hedge fund analysts. Answer every section below independently, "
+            "exactly as that section's instructions ask. The attached images belong to the 'chart' section.\n\n"
+            f"{combined}\n\n"
+            f"{parser.get_format_instructions()}"
+        )
+
+        message = HumanMessage(
+            content=[{"type": "text", "text": instructions}]
+            + [{"type": "image_url", "image_url": {"url": uri}} for uri in images]
+        )
+
+        print("🤖 [Batched Analyst Agent] Sending all six analyses to Gemini in one request...")
+        return symbol, today, message
+
+    def _report(symbol: str, today: str, reply) -> dict:
+        try:
+            sections = parser.invoke(reply)
+            if not isinstance(sections, dict):
+                raise OutputParserException(f"Expected a JSON object, got {type(sections).__name__}")
+        except OutputParserException:
+            # One unparseable reply must not sink the whole run; mark every section instead
+            print("⚠️ [Batched Analyst Agent] Reply was not valid JSON; no section could be read.")
+            sections = dict.fromkeys(SECTIONS, "(batched analysis unavailable)")
+        else:
+            print("✅ [Batched Analyst Agent] Analysis complete.")
+        print("-" * 60 + "\n")
+
+        result = {"symbol": symbol}
+        for name, (key, title, date_emoji) in SECTIONS.items():
+            report_header = format_box((
+                f"{title} for {symbol}",
+                f"{date_emoji} Date: {today}"
+            ), width=90)
+            body = str(sections.get(name) or "").strip() or "(no analysis returned)"
+            full_report = f"{report_header}\n{body}\n"
+            print(full_report)
+            result[key] = full_report
+
+        return result
+
+    def _invoke(state: dict) -> dict:
+        symbol, today, message = _prepare(state)
+        return _report(symbol, today, get_llm().invoke([message]))
+
+    async def _ainvoke(state: dict) -> dict:
+        # Yahoo/news/Reddit fetches and chart rendering block; keep them off the event loop
+        symbol, today, message = await asyncio.to_thread(_prepare, state)
+        return _report(symbol, today, await get_llm().ainvoke([message]))
+
+    return RunnableLambda(_invoke, afunc=_ainvoke)
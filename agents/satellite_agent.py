@@ -1,33 +1,27 @@
+import asyncio
+import re
 from typing import Dict, Any
-from datetime import datetime
-from satellite.router import run_satellite_module
-from tools.yahoo_finance import get_fundamentals
-from langchain_google_genai import ChatGoogleGenerativeAI
+from tools.clock import today_str
+from agents._llm import get_llm
 from langchain_core.messages import SystemMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
 from tools.format import format_box
 
-# Single shared model; temp=0 for deterministic JSON
-llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0)
+# First '{' through last '}' (greedy, across newlines); compiled once at import
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
 
 
 def _extract_json(text: str) -> str:
     """
     Make sure we return STRICT JSON:
-    - Strip markdown fences ```json ... ```
+    - Strip a leading ```json / ``` fence and a trailing ``` fence
+      (only the fences, so backticks inside JSON strings survive)
     - Trim whitespace
-    - If multiple braces exist, grab the first {...} block
+    - Grab the outermost {...} block, dropping any prose around it
     """
-    s = text.strip()
-    if s.startswith("```"):
-        # Remove leading/trailing fenced block
-        s = s.strip("`")
-        # after stripping backticks, try to find first { ... } span
-    # Try to locate the first JSON object
-    start = s.find("{")
-    end = s.rfind("}")
-    if start != -1 and end != -1 and end > start:
-        return s[start:end+1]
-    return s  # best effort; caller will json.loads() and raise if invalid
+    s = text.strip().removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+    m = _JSON_RE.search(s)
+    return m.group(0) if m else s  # best effort; caller will json.loads() and raise if invalid
 
 
 def llm_adapter(*, system: str, user: str) -> str:
@@ -35,7 +29,8 @@ def llm_adapter(*, system: str, user: str) -> str:
     Adapter: accepts system + user strings, returns STRICT JSON string.
     Uses LangChain ChatGoogleGenerativeAI under the hood.
     """
-    resp = llm.invoke([
+    # Shared model (temp=0 keeps the JSON deterministic)
+    resp = get_llm().invoke([
         SystemMessage(content=system),
         HumanMessage(content=user),
     ])
@@ -61,10 +56,10 @@ def format_satellite_report(symbol: str, today: str, summary: dict) -> str:
         Nicely formatted report string.
     """
     # Header box
-    report_header = format_box([
+    report_header = format_box((
         f"🛰️ Satellite Summary Report for {symbol}",
         f"📅 Date: {today}"
-    ], width=90)
+    ), width=90)
 
     # Extract fields
     headline = summary.get("headline", "No headline")
@@ -90,14 +85,20 @@ def satellite_agent(
     """
     LangGraph-compatible node factory.
     Runs Plan → Observe → Explain and stores a JSON string in 'satellite_report'.
+    The async path runs the (blocking) pipeline in a worker thread.
     """
     sites_db = sites_db or {}
     proxies_db = proxies_db or {}
 
     def node(state: Dict[str, Any]) -> Dict[str, Any]:
+        # Satellite/Yahoo deps (numpy, tifffile, shapely, yfinance) load on first use
+        from satellite.router import run_satellite_module
+        from tools.yahoo_finance import get_fundamentals
+
         symbol = state.get("symbol")
-        industry = get_fundamentals(symbol).get('industry')
-        today = datetime.today().strftime("%Y-%m-%d")
+        fundamentals = (state.get("yf_cache") or {}).get("fundamentals") or get_fundamentals(symbol)
+        industry = fundamentals.get('industry')
+        today = today_str()
 
         print("-" * 60)
         print(f"🛰️ [Satellite Agent] Running satellite analysis for {symbol} in industry {industry}...")
@@ -123,4 +124,8 @@ def satellite_agent(
             "satellite_report": full_report
         }
 
-    return node
+    async def anode(state: Dict[str, Any]) -> Dict[str, Any]:
+        # Sentinel Hub requests and both LLM calls block; keep them off the event loop
+        return await asyncio.to_thread(node, state)
+
+    return RunnableLambda(node, afunc=anode)
@@ -0,0 +1,28 @@
+import json
+
+from agents.satellite_agent import _extract_json
+
+
+def test_strips_json_fence():
+    """Test that a ```json fenced reply yields the bare object."""
+    raw = '```json\n{"headline": "ok", "bullets": []}\n```'
+    assert json.loads(_extract_json(raw)) == {"headline": "ok", "bullets": []}
+
+
+def test_keeps_backticks_inside_strings():
+    """Test that only the fences are removed, not backticks inside JSON values."""
+    raw = '```\n{"note": "use `NDVI` here"}\n```'
+    assert json.loads(_extract_json(raw)) == {"note": "use `NDVI` here"}
+
+
+def test_drops_surrounding_prose():
+    """Test that prose before/after the outermost object is discarded."""
+    raw = 'Here you go: {"a": {"b": 1}} Hope this helps!'
+    assert json.loads(_extract_json(raw)) == {"a": {"b": 1}}
+
+
+if __name__ == "__main__":
+    test_strips_json_fence()
+    test_keeps_backticks_inside_strings()
+    test_drops_surrounding_prose()
+    print("✅ All tests passed.")
@@ -1,23 +1,46 @@
 from langchain_core.runnables import RunnableLambda
-from langchain_google_genai import ChatGoogleGenerativeAI
+from tools.clock import today_str
+from agents._llm import astream_text, stream_text
+from tools.file_cache import FileCache
 from tools.format import format_box
-from datetime import datetime
 
-llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0)
+# Thesis for an identical prompt (same reports, same day) is reused instead of re-generated
+_thesis_cache = FileCache("agents/investment_thesis", ttl=24 * 3600)
+
+
+def _summarize(report: str, max_chars: int = 1200) -> str:
+    """
+    Trim one analyst report for the strategist prompt: drop its boxed header
+    (the prompt labels each section already) and cap the body at `max_chars`,
+    cutting at a line break so numbered points stay whole.
+    """
+    lines = report.strip().splitlines()
+    if lines and lines[0].startswith("===="):
+        # format_box header: "====" rule, centered lines, "====" rule
+        end = next((i for i in range(1, len(lines)) if lines[i].startswith("====")), len(lines) - 1)
+        lines = lines[end + 1:]
+    body = "\n".join(lines).strip()
+    if len(body) <= max_chars:
+        return body
+    cut = body.rfind("\n", 0, max_chars)
+    return body[:cut if cut > 0 else max_chars] + "\n…[truncated]"
 
 
 def strategist_agent() -> RunnableLambda:
     """
     Strategist Agent:
-    Aggregates all agent reports (fundamental, news, sentiment, OPTIONAL satellite)
-    and generates a professional investment outlook.
+    Aggregates all agent reports (fundamental, earnings, insider, chart, news,
+    sentiment, OPTIONAL satellite) and generates a professional investment outlook.
 
     Expects state with keys:
       - 'symbol' (str)
       - 'fundamental_report' (str)
+      - 'earnings_report' (str)
+      - 'insider_report' (str)
+      - 'chart_report' (str)
       - 'news_report' (str)
       - 'sentiment_report' (str)
-      - OPTIONAL 'satellite_report' (JSON string produced by satellite module)
+      - OPTIONAL 'satellite_report' (formatted satellite summary)
 
     Returns:
         {
@@ -25,27 +48,30 @@ def strategist_agent() -> RunnableLambda:
             "investment_thesis": formatted string summary
         }
     """
-    def _invoke(state: dict) -> dict:
+    def _prepare(state: dict):
+        """Build the synthesis prompt and print the report header ahead of the streamed thesis."""
         symbol = state["symbol"]
-        today = datetime.today().strftime("%Y-%m-%d")
+        today = today_str()
 
         print("-" * 60)
         print(f"📊 [Strategist Agent] Synthesizing insights for {symbol}...")
-        print("🧩 Aggregating reports from fundamental, news, sentiment, and satellite...")
+        print("🧩 Aggregating reports from fundamental, earnings, insider, chart, news, sentiment, and satellite...")
 
-        # Collect agent outputs
-        fundamental = state.get("fundamental_report", "")
-        earnings = state.get("earnings_report", "")
-        insider = state.get("insider_report", "")
-        news = state.get("news_report", "")
-        sentiment = state.get("sentiment_report", "")
-        satellite = state.get("satellite_report", "")
+        # Collect agent outputs (header-less, length-capped to bound prompt tokens)
+        fundamental = _summarize(state.get("fundamental_report", ""))
+        earnings = _summarize(state.get("earnings_report", ""))
+        insider = _summarize(state.get("insider_report", ""))
+        chart = _summarize(state.get("chart_report", ""))
+        news = _summarize(state.get("news_report", ""))
+        sentiment = _summarize(state.get("sentiment_report", ""))
+        satellite = _summarize(state.get("satellite_report", ""))
 
         # Combine into context
         combined_context = (
             f"Fundamental Report:\n{fundamental}\n\n"
             f"Earnings:\n{earnings}\n\n"
             f"Insider Transactions Report:\n{insider}\n\n"
+            f"Chart Analysis Report:\n{chart}\n\n"
             f"News Report:\n{news}\n\n"
             f"Reddit Sentiment Report:\n{sentiment}\n\n"
             f"Satellite Report:\n{satellite}\n\n"
@@ -65,24 +91,51 @@ def strategist_agent() -> RunnableLambda:
             "Respond in a clean, professional format using numbered bullet points."
         )
 
-        print("🤖 [Strategist Agent] Calling LLM for final investment outlook...")
-        thesis = llm.invoke(prompt).content.strip()
-
         # Header box
-        report_header = format_box([
+        report_header = format_box((
             f"📈 Investment Strategy Report for {symbol}",
             f"🗓️ Date: {today}"
-        ], width=90)
+        ), width=90)
+
+        key = _thesis_cache.make_key(prompt)
+        cached = _thesis_cache.get(key)
+        if cached is not None:
+            print("♻️ [Strategist Agent] Same reports as a recent run; reusing its outlook:\n")
+            print(report_header)
+            print(cached)
+            return symbol, report_header, prompt, key, cached
+
+        # Print the header up front, then echo the thesis token-by-token as it streams in
+        print("🤖 [Strategist Agent] Calling LLM for final investment outlook...")
+        print("📝 [Strategist Agent] Streaming final report:\n")
+        print(report_header)
+        return symbol, report_header, prompt, key, None
+
+    def _invoke(state: dict) -> dict:
+        symbol, report_header, prompt, key, thesis = _prepare(state)
+        if thesis is None:
+            thesis = stream_text(prompt, echo=True)
+            if thesis:
+                _thesis_cache.set(key, thesis)
 
         # Full formatted report
-        full_report = f"{report_header}\n{thesis}\n"
+        return {
+            "symbol": symbol,
+            "investment_thesis": f"{report_header}\n{thesis}\n"
+        }
 
-        print("✅ [Strategist Agent] Final report generated:\n")
-        print(full_report)
+    async def _ainvoke(state: dict) -> dict:
+        # Only a small cache-file read before the LLM call, so no worker thread needed
+        symbol, report_header, prompt, key, thesis = _prepare(state)
+        if thesis is None:
+            thesis = await astream_text(prompt, echo=True)
+            if thesis:
+                _thesis_cache.set(key, thesis)
 
+        # Full formatted report
         return {
             "symbol": symbol,
-            "investment_thesis": full_report
+            "investment_thesis": f"{report_header}\n{thesis}\n"
         }
 
-    return RunnableLambda(_invoke)
+    return RunnableLambda(_invoke, afunc=_ainvoke)
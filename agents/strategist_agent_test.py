@@ -0,0 +1,43 @@
+import agents.strategist_agent as strategist_module
+from agents.strategist_agent import _summarize, strategist_agent
+from tools.file_cache import FileCache
+from tools.format import format_box
+
+
+def test_strategist_uses_satellite_and_tolerates_missing_reports(monkeypatch, tmp_path):
+    """Test that the satellite report reaches the prompt and absent reports don't raise."""
+    monkeypatch.setattr(strategist_module, "_thesis_cache", FileCache("thesis", root=str(tmp_path)))
+    prompts = []
+
+    def fake_stream_text(prompt, echo=False):
+        prompts.append(prompt)
+        return "1. Thesis"
+
+    monkeypatch.setattr(strategist_module, "stream_text", fake_stream_text)
+
+    result = strategist_agent().invoke({
+        "symbol": "TSLA",
+        "satellite_report": "SATELLITE-MARKER",
+    })
+
+    assert "SATELLITE-MARKER" in prompts[0]
+    assert "Investment Strategy Report for TSLA" in result["investment_thesis"]
+    assert result["investment_thesis"].rstrip().endswith("1. Thesis")
+
+    # Identical reports again: the cached thesis is reused without another LLM call
+    again = strategist_agent().invoke({"symbol": "TSLA", "satellite_report": "SATELLITE-MARKER"})
+    assert len(prompts) == 1
+    assert again["investment_thesis"] == result["investment_thesis"]
+
+
+def test_summarize_drops_header_and_caps_length():
+    """Test that _summarize strips the boxed header and truncates on a line boundary."""
+    header = format_box(("📊 Fundamental Analysis Report for TSLA", "📅 Date: 2025-01-01"), width=90)
+    body = "\n".join(f"{i}. " + "x" * 50 for i in range(1, 40))
+    out = _summarize(f"{header}\n{body}\n", max_chars=200)
+
+    assert "Fundamental Analysis Report" not in out
+    assert out.startswith("1. ")
+    assert out.endswith("…[truncated]")
+    assert len(out) <= 200 + len("\n…[truncated]")
+    assert _summarize("short") == "short"
@@ -1,7 +1,7 @@
-from dotenv import load_dotenv
-load_dotenv()
-from langgraph.graph import StateGraph
-from typing import TypedDict
+from functools import lru_cache
+from langgraph.graph import StateGraph, START, END
+from typing import Annotated, TypedDict
+from tools.yahoo_finance import get_symbol_bundle
 from agents.fundamental_agent import fundamental_agent
 from agents.news_agent import news_agent
 from agents.sentiment_agent import sentiment_agent
@@ -10,92 +10,122 @@ from agents.satellite_agent import satellite_agent
 from agents.earnings_agent import quarterly_earnings_agent
 from agents.insider_transaction_agent import insider_transaction_agent
 from agents.chart_agent import chart_agent
+from agents.multi_analyst import multi_analyst_agent
+
+
+def _keep_symbol(current: str, update: str) -> str:
+    """
+    Reducer for the shared 'symbol' key.
+    Every parallel agent echoes the symbol back in the same step,
+    so keep the value we started with instead of raising on concurrent writes.
+    """
+    return current or update
 
 
 class GraphState(TypedDict):
-    symbol: str
-    # Individual agent reports
+    symbol: Annotated[str, _keep_symbol]
+    # Individual agent reports (one key per agent, so parallel writes never collide)
     fundamental_report: str
-    quarterly_report: str
+    earnings_report: str
     insider_report: str
     chart_report: str
     news_report: str
     sentiment_report: str
     satellite_report: str
-    strategist_summary: str
-    # Aggregated text for chart agent
-    plot_query: str
-
-
-def build_graph():
+    # Final synthesis
+    investment_thesis: str
+    # Per-run Yahoo Finance data shared by all agents (filled by prefetch)
+    yf_cache: dict
+
+
+# Analysts that read Yahoo Finance data; they start once prefetch is done.
+YAHOO_NODES = (
+    "fundamental",
+    "quarterly_earnings",
+    "insider_transaction",
+    "chart_agent",
+    "satellite",
+)
+
+# Analysts with their own data sources; they start right away, alongside prefetch.
+INDEPENDENT_NODES = (
+    "news",
+    "sentiment",
+)
+
+
+def prefetch(state: dict) -> dict:
+    """
+    Fetch all Yahoo Finance data for the symbol once per run, concurrently,
+    so downstream agents read it from state['yf_cache'] instead of refetching.
+    """
+    symbol = state["symbol"]
+    print(f"📡 [Prefetch] Fetching Yahoo Finance data for {symbol}...")
+    return {"yf_cache": get_symbol_bundle(symbol, last_n=15, max_quarters=8)}
+
+
+def build_graph(batched: bool = False):
+    """
+    batched=True swaps the six LLM analysts for one multi-section Gemini request
+    (agents.multi_analyst), cutting analyst round-trips from six to one.
+    """
     builder = StateGraph(state_schema=GraphState)
 
     # ---------------------------
-    # Layer 1: Parallel fetchers
+    # Layer 0: Shared data prefetch
     # ---------------------------
-    builder.add_node("fundamental", fundamental_agent())
-    builder.add_node("quarterly_earnings", quarterly_earnings_agent())
-    builder.add_node("insider_transaction", insider_transaction_agent())
+    builder.add_node("prefetch", prefetch)
 
     # ---------------------------
-    # Layer 2: Aggregator
+    # Layer 1: Parallel analysts
     # ---------------------------
-    def gather_reports(state: dict) -> dict:
-        """
-        Combine Layer 1 reports into a single plot_query string.
-        """
-        return {
-            **state,
-            "plot_query": "\n\n".join(
-                [
-                    state.get("fundamental_report", ""),
-                    state.get("quarterly_report", ""),
-                    state.get("insider_report", ""),
-                ]
-            )
-        }
-
-    builder.add_node("gather_reports", gather_reports)
+    if batched:
+        builder.add_node("analysts", multi_analyst_agent())
+        builder.add_node("satellite", satellite_agent())
+        yahoo_nodes, independent_nodes = ("analysts", "satellite"), ()
+    else:
+        builder.add_node("fundamental", fundamental_agent())
+        builder.add_node("quarterly_earnings", quarterly_earnings_agent())
+        builder.add_node("insider_transaction", insider_transaction_agent())
+        builder.add_node("chart_agent", chart_agent())
+        builder.add_node("news", news_agent())
+        builder.add_node("sentiment", sentiment_agent())
+        builder.add_node("satellite", satellite_agent())
+        yahoo_nodes, independent_nodes = YAHOO_NODES, INDEPENDENT_NODES
 
     # ---------------------------
-    # Layer 3: Visualization
-    # ---------------------------
-    builder.add_node("chart_agent", chart_agent())
-
-    # ---------------------------
-    # Layer 4: Contextual
-    # ---------------------------
-    builder.add_node("news", news_agent())
-    builder.add_node("sentiment", sentiment_agent())
-    builder.add_node("satellite", satellite_agent())
-
-    # ---------------------------
-    # Layer 5: Final strategist
+    # Layer 2: Final strategist
     # ---------------------------
     builder.add_node("strategist", strategist_agent())
 
     # ---------------------------
-    # Edges (multi-layer flow)
+    # Edges (fan-out / fan-in)
     # ---------------------------
 
-    # Entry → parallel layer
-    builder.set_entry_point("fundamental")
-    builder.add_edge("fundamental", "gather_reports")
-    builder.add_edge("quarterly_earnings", "gather_reports")
-    builder.add_edge("insider_transaction", "gather_reports")
+    # Entry → prefetch + independent analysts (branches run concurrently)
+    builder.add_edge(START, "prefetch")
+    for node in independent_nodes:
+        builder.add_edge(START, node)
 
-    # Gather → visualization
-    builder.add_edge("gather_reports", "chart_agent")
+    # Prefetch → Yahoo-backed analysts
+    for node in yahoo_nodes:
+        builder.add_edge("prefetch", node)
 
-    # Visualization → contextual → strategist
-    builder.add_edge("chart_agent", "news")
-    builder.add_edge("news", "sentiment")
-    builder.add_edge("sentiment", "satellite")
-    builder.add_edge("satellite", "strategist")
+    # Join barrier: strategist waits until all analysts have reported
+    builder.add_edge(list(yahoo_nodes + independent_nodes), "strategist")
 
     # Final step
-    builder.set_finish_point("strategist")
+    builder.add_edge("strategist", END)
 
     # Compile the graph into a runnable flow
     return builder.compile()
 
+
+@lru_cache(maxsize=2)
+def get_graph(batched: bool = False):
+    """
+    Compiled graph for the given config, built once per process.
+    The graph keeps no per-run state (no checkpointer), so one instance
+    can serve every ticker, including concurrent ainvoke calls.
+    """
+    return build_graph(batched=batched)
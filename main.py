@@ -1,18 +1,20 @@
-from graph.thesis_graph import build_graph
-from tools.format import format_box
 from dotenv import load_dotenv
-
 load_dotenv()
+import asyncio
+import sys
+from graph.thesis_graph import get_graph
+from tools.format import format_box
+from tools.yahoo_finance import get_history_many
 
 
 def welcome():
-    content = [
+    content = (
         "📈 Welcome to HedgeMind AI",
         "",
         "A multi-agent, multi-modal research system for U.S. equities.",
         "It integrates fundamentals, earnings, insider activity, news, sentiment,",
         "and strategy to deliver professional-grade investment insights."
-    ]
+    )
     print("\n" + format_box(content, width=90) + "\n")
 
 
@@ -24,13 +26,43 @@ def main():
         print("❌ No symbol entered. Exiting.")
         return
 
-    message = f"📡 Running multi-agent analysis for {symbol.upper()}..."
-    print("\n" + format_box([message], width=90) + "\n")
-    graph = build_graph()
-    graph.invoke({
+    message = f"📡 Running multi-agent analysis for {symbol}..."
+    print("\n" + format_box((message,), width=90) + "\n")
+    graph = get_graph()
+    # Async run: LLM calls are awaited on one event loop, blocking fetches go to worker threads
+    asyncio.run(graph.ainvoke({
         "symbol": symbol,
-    })
+    }))
+
+
+def main_batch(symbols: list[str], max_concurrency: int = 2):
+    """
+    Analyze several tickers with one compiled graph.
+    Up to `max_concurrency` runs overlap their LLM and HTTP calls,
+    so their console output interleaves.
+    """
+    welcome()
+
+    symbols = [s.upper().strip() for s in symbols if s.strip()]
+    if not symbols:
+        print("❌ No symbol entered. Exiting.")
+        return
+
+    message = f"📡 Running multi-agent analysis for {', '.join(symbols)}..."
+    print("\n" + format_box((message,), width=90) + "\n")
+    # One batched price download for every ticker plus the chart benchmark,
+    # instead of one history request per ticker inside each run
+    get_history_many(symbols + ["SPY"])
+    graph = get_graph()
+    return asyncio.run(graph.abatch(
+        [{"symbol": symbol} for symbol in symbols],
+        config={"max_concurrency": max_concurrency},
+    ))
 
 
 if __name__ == "__main__":
-    main()
+    # `python main.py TSLA GOOG` runs a batch; no arguments prompts for one ticker
+    if len(sys.argv) > 1:
+        main_batch(sys.argv[1:])
+    else:
+        main()
@@ -1,23 +1,46 @@
-import os, io, math
+import os, io, math, time, threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import List
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import numpy as np
 from tifffile import imread as tiff_read
 from shapely.geometry import shape
 from .schemas import Observation, ObservationResult, ObservationPlan, Target
-from .features import ndvi, pct_change, mean_over_mask, quality_from_valid_ratio
+from .features import ndvi_mean_over_mask, pct_change, quality_from_valid_ratio
 from dotenv import load_dotenv
 
 AUTH_API = "https://services.sentinel-hub.com/oauth/token"
 PROCESS_API = "https://services.sentinel-hub.com/api/v1/process"
 
+# One pooled session for every Sentinel Hub call, so TCP/TLS connections are reused
+# across the concurrent tile requests (up to 2 windows x 2 dates in flight per target).
+# Rate limits and transient 5xx are retried with backoff (honoring Retry-After) instead of
+# silently dropping the date; token and Process API POSTs have no side effects, so retrying is safe.
+_retry = Retry(
+    total=3,
+    backoff_factor=1.0,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False,
+)
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=_retry))
+
+# OAuth token reused until shortly before it expires
+_token_cache = {"token": None, "expires_at": 0.0}
+_token_lock = threading.Lock()
+
+# Raw digital numbers (reflectance x 10000) as UINT16: half the bytes of FLOAT32 on the
+# wire and in memory. NDVI is a band ratio, so it needs no rescaling back to reflectance.
 S2_EVALSCRIPT_BANDS = """
 //VERSION=3
 function setup() {
   return {
-    input: ["B04","B08","dataMask"],
-    output: { bands: 3, sampleType: "FLOAT32" }
+    input: [{ bands: ["B04","B08","dataMask"], units: "DN" }],
+    output: { bands: 3, sampleType: "UINT16" }
   };
 }
 function evaluatePixel(s) {
@@ -26,16 +49,23 @@ function evaluatePixel(s) {
 """
 
 def _auth_token() -> str:
-    load_dotenv()
-    cid = os.getenv("SENTINELHUB_CLIENT_ID")
-    cs  = os.getenv("SENTINELHUB_CLIENT_SECRET")
-    if not cid or not cs:
-        raise RuntimeError("Set SENTINELHUB_CLIENT_ID/SECRET in .env")
-    r = requests.post(AUTH_API, data={
-        "grant_type":"client_credentials","client_id":cid,"client_secret":cs
-    }, timeout=30)
-    r.raise_for_status()
-    return r.json()["access_token"]
+    with _token_lock:
+        if _token_cache["token"] and time.time() < _token_cache["expires_at"]:
+            return _token_cache["token"]
+        load_dotenv()
+        cid = os.getenv("SENTINELHUB_CLIENT_ID")
+        cs  = os.getenv("SENTINELHUB_CLIENT_SECRET")
+        if not cid or not cs:
+            raise RuntimeError("Set SENTINELHUB_CLIENT_ID/SECRET in .env")
+        r = _session.post(AUTH_API, data={
+            "grant_type":"client_credentials","client_id":cid,"client_secret":cs
+        }, timeout=30)
+        r.raise_for_status()
+        body = r.json()
+        _token_cache["token"] = body["access_token"]
+        # Refresh a minute early so a token never expires mid-request
+        _token_cache["expires_at"] = time.time() + float(body.get("expires_in", 3600)) - 60
+        return _token_cache["token"]
 
 
 def _bbox_from_target(t: Target) -> List[float]:
@@ -51,18 +81,26 @@ def _bbox_from_target(t: Target) -> List[float]:
     return [t.lon - dlon, t.lat - dlat, t.lon + dlon, t.lat + dlat]
 
 
-def _fetch_s2_stack(token: str, bbox: List[float], start: datetime, end: datetime, width=768, height=None):
-    # Returns list of (timestamp_iso, array[H,W,3]=[B04,B08,mask])
+def _ndvi_mean(arr):
+    b04, b08, mask = arr[...,0], arr[...,1], arr[...,2]>0.5
+    return ndvi_mean_over_mask(b08, b04, mask)
+
+
+def _fetch_s2_stack(token: str, bbox: List[float], start: datetime, end: datetime, width=768, height=None,
+                    max_cloud_coverage=40):
+    # Returns list of (timestamp_iso, ndvi_mean, valid_ratio), one per usable date.
+    # Each tile is reduced in its fetch worker as soon as it arrives, overlapping with the
+    # other downloads, and the H×W×3 array is dropped right away instead of held until all finish.
     # For simplicity, sample at 2 dates: (end) and (end-15d) → enough for 30d average proxy
     dates = [end, end - timedelta(days=15)]
-    out = []
-    for dt in dates:
+
+    def _fetch_one(dt: datetime):
         payload = {
             "input": {
                 "bounds": {"bbox": bbox},
                 "data": [{"type":"S2L2A","dataFilter":{
                     "timeRange":{"from":(dt - timedelta(days=7)).isoformat()+"Z","to":dt.isoformat()+"Z"},
-                    "maxCloudCoverage": 40
+                    "maxCloudCoverage": max_cloud_coverage
                 }}]
             },
             "output": {
@@ -72,34 +110,36 @@ def _fetch_s2_stack(token: str, bbox: List[float], start: datetime, end: datetim
             },
             "evalscript": S2_EVALSCRIPT_BANDS
         }
-        r = requests.post(PROCESS_API, headers={"Authorization":f"Bearer {token}"}, json=payload, timeout=90)
+        r = _session.post(PROCESS_API, headers={"Authorization":f"Bearer {token}"}, json=payload, timeout=90)
         if r.status_code != 200:
-            continue
-        arr = tiff_read(io.BytesIO(r.content))  # (H,W,3): B04,B08,mask
+            return None
+        arr = tiff_read(io.BytesIO(r.content))  # (H,W,3) uint16: B04,B08,mask
         if arr.ndim==2: arr = arr[...,None]
-        out.append((dt.replace(tzinfo=timezone.utc).isoformat(), arr.astype(np.float32)))
+        return (dt.replace(tzinfo=timezone.utc).isoformat(), *_ndvi_mean(arr))  # uint16; NDVI kernel upcasts
+
+    # Both dates are independent requests; fetch them concurrently (order preserved)
+    with ThreadPoolExecutor(max_workers=len(dates)) as pool:
+        out = [item for item in pool.map(_fetch_one, dates) if item is not None]
     return out  # possibly length 0..2
 
-def compute_ndvi_change_for_target(t: Target) -> List[Observation]:
+def compute_ndvi_change_for_target(t: Target, width=768, max_cloud_coverage=40) -> List[Observation]:
+    # width / max_cloud_coverage let callers trade resolution and scene strictness for speed
     token = _auth_token()
     bbox = _bbox_from_target(t)
     now = datetime.utcnow().replace(tzinfo=timezone.utc)
-    # Fetch two samples within last 30d window
-    stack_curr = _fetch_s2_stack(token, bbox, now - timedelta(days=0), now)
-    stack_prev = _fetch_s2_stack(token, bbox, now - timedelta(days=30), now - timedelta(days=30))
+    # Fetch two samples within last 30d window; the curr/prev windows are independent
+    # network round-trips, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        opts = {"width": width, "max_cloud_coverage": max_cloud_coverage}
+        f_curr = pool.submit(_fetch_s2_stack, token, bbox, now - timedelta(days=0), now, **opts)
+        f_prev = pool.submit(_fetch_s2_stack, token, bbox, now - timedelta(days=30), now - timedelta(days=30), **opts)
+        stack_curr, stack_prev = f_curr.result(), f_prev.result()
     obs: List[Observation] = []
 
-    def _ndvi_mean(arr):
-        b04, b08, mask = arr[...,0], arr[...,1], arr[...,2]>0.5
-        val = mean_over_mask(ndvi(b08,b04), mask)
-        valid_ratio = float(np.mean(mask))
-        return val, valid_ratio
-
     if stack_curr:
         curr_vals = []
         curr_valids = []
-        for ts, arr in stack_curr:
-            v, vr = _ndvi_mean(arr)
+        for ts, v, vr in stack_curr:
             if not np.isnan(v):
                 curr_vals.append(v); curr_valids.append(vr)
         curr_mean = float(np.mean(curr_vals)) if curr_vals else float("nan")
@@ -110,8 +150,7 @@ def compute_ndvi_change_for_target(t: Target) -> List[Observation]:
     if stack_prev:
         prev_vals = []
         prev_valids = []
-        for ts, arr in stack_prev:
-            v, vr = _ndvi_mean(arr)
+        for ts, v, vr in stack_prev:
             if not np.isnan(v):
                 prev_vals.append(v); prev_valids.append(vr)
         prev_mean = float(np.mean(prev_vals)) if prev_vals else float("nan")
@@ -132,6 +171,12 @@ def compute_ndvi_change_for_target(t: Target) -> List[Observation]:
     ))
     return obs
 
+# (sensor, feature) pairs the executor can compute
+SUPPORTED_FEATURES = frozenset({
+    ("S2", "NDVI_mean_30d_vs_prev30d"),
+})
+
+
 def execute_plan(plan: ObservationPlan) -> ObservationResult:
     result = ObservationResult(ticker=plan.ticker)
     if not plan.use_satellite or not plan.targets:
@@ -139,12 +184,13 @@ def execute_plan(plan: ObservationPlan) -> ObservationResult:
         return result
 
     for t in plan.targets:
-        # Only implement NDVI for now; safely ignore unknown metrics
-        for s in t.sensors:
-            for feat in s.features:
-                if s.type=="S2" and feat=="NDVI_mean_30d_vs_prev30d":
-                    result.observations += compute_ndvi_change_for_target(t)
-                # TODO: add handlers for NDWI_ship_count_wow, SAR_VV_delta_30d, etc.
+        # Only implement NDVI for now; unknown metrics are ignored, and duplicate
+        # (sensor, feature) entries collapse so nothing is fetched twice.
+        # Targets with nothing supported never reach Sentinel Hub (no auth, no fetch).
+        wanted = {(s.type, feat) for s in t.sensors for feat in s.features} & SUPPORTED_FEATURES
+        if ("S2", "NDVI_mean_30d_vs_prev30d") in wanted:
+            result.observations += compute_ndvi_change_for_target(t)
+        # TODO: add handlers for NDWI_ship_count_wow, SAR_VV_delta_30d, etc.
 
     if not result.observations:
         result.gaps.append("No usable scenes or features computed")
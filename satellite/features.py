@@ -60,10 +60,57 @@ def mean_over_mask(arr: np.ndarray, mask: np.ndarray) -> float:
     float
         Mean value over the masked region. Returns NaN if no valid pixels.
     """
-    m = arr[mask]
-    if m.size == 0:
+    # Count + one multiply-sum; no compacted arr[mask] copy on the common NaN-free path
+    n_valid = int(np.count_nonzero(mask))
+    if n_valid == 0:
         return float("nan")
-    return float(np.nanmean(m))
+    total = float(np.sum(arr * mask, dtype=np.float64))
+    if np.isnan(total):
+        # NaN pixels present (rare): keep np.nanmean semantics
+        return float(np.nanmean(arr[mask]))
+    return total / n_valid
+
+
+def ndvi_mean_over_mask(b08: np.ndarray, b04: np.ndarray, mask: np.ndarray) -> tuple[float, float]:
+    """
+    Fused equivalent of mean_over_mask(ndvi(b08, b04), mask), plus the valid-pixel ratio.
+
+    NDVI is computed in place in one H×W buffer, invalid pixels are zeroed by
+    multiplying with the mask, and the buffer is summed once; no compacted
+    arr[mask] copy or nanmean pass is needed. Bands may be float reflectance or
+    integer digital numbers (e.g. uint16); NDVI is scale-invariant.
+
+    Parameters
+    ----------
+    b08 : np.ndarray
+        Near-Infrared band (Sentinel-2 B08).
+    b04 : np.ndarray
+        Red band (Sentinel-2 B04).
+    mask : np.ndarray
+        Boolean mask (True = valid pixel, False = ignore).
+
+    Returns
+    -------
+    tuple[float, float]
+        (mean NDVI over the mask, NaN if no valid pixels;
+         fraction of pixels that are valid).
+    """
+    n_valid = int(np.count_nonzero(mask))
+    valid_ratio = n_valid / mask.size if mask.size else 0.0
+    if n_valid == 0:
+        return float("nan"), valid_ratio
+
+    # float32 results even for uint16 DN bands (no wrap-around, no separate astype copy)
+    out = np.subtract(b08, b04, dtype=np.float32)
+    den = np.add(b08, b04, dtype=np.float32)
+    den += 1e-6
+    np.divide(out, den, out=out)
+    out *= mask
+    total = float(out.sum(dtype=np.float64))
+    if np.isnan(total):
+        # NaN pixels present (rare): fall back to the exact nanmean semantics
+        return float(np.nanmean(ndvi(b08, b04)[mask])), valid_ratio
+    return total / n_valid, valid_ratio
 
 
 def quality_from_valid_ratio(valid_ratio: float, scene_age_days: float) -> float:
@@ -0,0 +1,67 @@
+import math
+
+import numpy as np
+
+from satellite.features import mean_over_mask, ndvi, ndvi_mean_over_mask
+
+
+def _tile(seed: int = 0, size: int = 64):
+    rng = np.random.default_rng(seed)
+    arr = rng.random((size, size, 3), dtype=np.float32)
+    arr[..., 2] = rng.random((size, size)) > 0.3
+    return arr[..., 0], arr[..., 1], arr[..., 2] > 0.5
+
+
+def test_fused_ndvi_mean_matches_reference():
+    """Test that the fused kernel equals mean_over_mask(ndvi(...)) and reports the valid ratio."""
+    b04, b08, mask = _tile()
+    value, valid_ratio = ndvi_mean_over_mask(b08, b04, mask)
+    assert math.isclose(value, mean_over_mask(ndvi(b08, b04), mask), rel_tol=1e-5)
+    assert math.isclose(valid_ratio, float(np.mean(mask)))
+
+
+def test_fused_ndvi_mean_ignores_nan_pixels():
+    """Test that NaN pixels are skipped exactly like np.nanmean."""
+    b04, b08, mask = _tile(seed=1)
+    b08 = b08.copy()
+    b08[0, :5] = np.nan
+    value, _ = ndvi_mean_over_mask(b08, b04, mask)
+    assert math.isclose(value, mean_over_mask(ndvi(b08, b04), mask), rel_tol=1e-5)
+
+
+def test_fused_ndvi_mean_empty_mask():
+    """Test that an all-invalid mask yields NaN and a zero valid ratio."""
+    b04, b08, mask = _tile()
+    value, valid_ratio = ndvi_mean_over_mask(b08, b04, np.zeros_like(mask))
+    assert math.isnan(value)
+    assert valid_ratio == 0.0
+
+
+def test_fused_ndvi_mean_uint16_digital_numbers():
+    """Test that uint16 DN bands (reflectance x 10000) give the reflectance NDVI without wrap-around."""
+    b04, b08, mask = _tile(seed=2)
+    dn04 = np.round(b04 * 10000).astype(np.uint16)
+    dn08 = np.round(b08 * 10000).astype(np.uint16)
+    value, _ = ndvi_mean_over_mask(dn08, dn04, mask)
+    expected = mean_over_mask(ndvi(dn08 / 10000.0, dn04 / 10000.0), mask)
+    assert math.isclose(value, expected, rel_tol=1e-4)
+
+
+def test_mean_over_mask_matches_nanmean_of_selection():
+    """Test mean_over_mask against np.nanmean(arr[mask]), with and without NaNs, and on an empty mask."""
+    rng = np.random.default_rng(3)
+    arr = rng.random((32, 32), dtype=np.float32)
+    mask = rng.random((32, 32)) > 0.5
+    assert math.isclose(mean_over_mask(arr, mask), float(np.nanmean(arr[mask])), rel_tol=1e-6)
+    arr[mask.nonzero()[0][0], mask.nonzero()[1][0]] = np.nan
+    assert math.isclose(mean_over_mask(arr, mask), float(np.nanmean(arr[mask])), rel_tol=1e-6)
+    assert math.isnan(mean_over_mask(arr, np.zeros_like(mask)))
+
+
+if __name__ == "__main__":
+    test_fused_ndvi_mean_matches_reference()
+    test_fused_ndvi_mean_ignores_nan_pixels()
+    test_fused_ndvi_mean_empty_mask()
+    test_fused_ndvi_mean_uint16_digital_numbers()
+    test_mean_over_mask_matches_nanmean_of_selection()
+    print("✅ All tests passed.")
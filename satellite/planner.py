@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from typing import Any, Callable, Dict, List, Optional
-import json
+import orjson
+from tools.file_cache import FileCache
 from .schemas import ObservationPlan
 
+# Raw planner JSON keyed on (prompts, ticker, industry, hints); 24h TTL.
+_plan_cache = FileCache("planner", ttl=24 * 3600)
+
 # Light industry-based default skip list.
 INDUSTRY_NO_NEED_SATELLITE = {
     "internet", "software", "saas", "fintech", "media", "advertising", "social media",
@@ -79,10 +83,14 @@ def build_plan(
     *,
     site_hints: Optional[List[Dict[str, Any]]] = None,
     proxy_hints: Optional[List[Dict[str, Any]]] = None,
+    use_cache: bool = True,
 ) -> ObservationPlan:
     """
     Call the planner LLM to produce an ObservationPlan.
 
+    Industries in INDUSTRY_NO_NEED_SATELLITE, and calls with neither an industry
+    nor any hints, return use_satellite=False without calling the LLM.
+
     Parameters
     ----------
     llm : Callable[..., str]
@@ -96,7 +104,7 @@ def build_plan(
 
     industry : Optional[str]
         Industry/category hint used for the skip rule and target selection.
-        If None, the planner will rely on hints and may still set use_satellite=false.
+        If None, the planner will rely on hints (no hints → use_satellite=false).
 
     site_hints : Optional[List[Dict[str, Any]]]
         Ephemeral, user-provided **company site** candidates. Each item is a dict that
@@ -109,6 +117,11 @@ def build_plan(
         Ephemeral **industry proxy** candidates (ports, belts, clusters, regions).
         Same shape as site_hints (name + either point+radius or polygon).
 
+    use_cache : bool
+        Reuse the raw planner JSON for an identical prompt from the last 24h
+        instead of calling the LLM. Pass False to force a fresh plan.
+        Plans built from hints are cached in memory only, never on disk.
+
     Returns
     -------
     ObservationPlan
@@ -122,9 +135,29 @@ def build_plan(
                 notes="Planner JSON parse error or no feasible targets."
             )
     """
+    # Decide the obvious skips locally; no LLM round-trip needed.
+    if industry and industry.strip().lower() in INDUSTRY_NO_NEED_SATELLITE:
+        return ObservationPlan(
+            ticker=ticker,
+            industry=industry,
+            use_satellite=False,
+            targets=[],
+            fallbacks=[],
+            notes="Skipped due to industry.",
+        )
+    if industry is None and not site_hints and not proxy_hints:
+        return ObservationPlan(
+            ticker=ticker,
+            industry=industry,
+            use_satellite=False,
+            targets=[],
+            fallbacks=[],
+            notes="No industry or runtime hints; nothing to observe.",
+        )
+
     # Serialize ephemeral hints (never persisted).
-    site_hints_json = json.dumps(site_hints or [], ensure_ascii=False, indent=2)
-    proxy_hints_json = json.dumps(proxy_hints or [], ensure_ascii=False, indent=2)
+    site_hints_json = orjson.dumps(site_hints or [], option=orjson.OPT_INDENT_2).decode()
+    proxy_hints_json = orjson.dumps(proxy_hints or [], option=orjson.OPT_INDENT_2).decode()
 
     # Build the user message.
     user_msg = PLANNER_USER_TEMPLATE.format(
@@ -135,9 +168,18 @@ def build_plan(
         industries_no_need_satellite=INDUSTRY_NO_NEED_SATELLITE
     )
 
+    # Replay a cached plan for the same inputs + prompts, if any (the key is a digest, not the hints).
+    # Keyed on inputs rather than user_msg: the skip-list set renders in a per-process order.
+    cache_key = _plan_cache.make_key(
+        PLANNER_SYSTEM, PLANNER_USER_TEMPLATE, ticker, industry, site_hints or [], proxy_hints or []
+    )
+    raw = _plan_cache.get(cache_key) if use_cache else None
+    fresh = raw is None
+
     # Call the LLM. We expect STRICT JSON back.
     try:
-        raw = llm(system=PLANNER_SYSTEM, user=user_msg)
+        if fresh:
+            raw = llm(system=PLANNER_SYSTEM, user=user_msg)
     except Exception as e:
         # LLM transport error → fail safe: skip satellite.
         return ObservationPlan(
@@ -149,7 +191,8 @@ def build_plan(
             notes=f"Planner call failed: {type(e).__name__}: {e}",
         )
 
-    # Parse JSON strictly with Pydantic; return a safe fallback on any error.
+    # Parse JSON strictly with Pydantic (its Rust parser beats orjson.loads + model_validate here);
+    # return a safe fallback on any error.
     try:
         plan = ObservationPlan.model_validate_json(raw)
     except Exception as e:
@@ -162,14 +205,11 @@ def build_plan(
             notes=f"Planner JSON parse error: {type(e).__name__}: {e}",
         )
 
-    # Optional: lightweight post-checks to enforce our guardrails at runtime too.
-    # If the industry looks like industry that no need satellite, force use_satellite=False as a sanity check.
-    if industry and industry.strip().lower() in INDUSTRY_NO_NEED_SATELLITE:
-        plan.use_satellite = False
-        plan.targets = []
-        plan.fallbacks = []
-        plan.notes = (plan.notes or "") + " Skipped due to industry."
+    # Only cache replies that validated. Hints are ephemeral, so plans derived from them stay in memory.
+    if fresh:
+        _plan_cache.set(cache_key, raw, persist=not (site_hints or proxy_hints))
 
+    # Optional: lightweight post-checks to enforce our guardrails at runtime too.
     # If the plan requested more than 2 targets, trim (LLM should obey, but we enforce).
     if len(plan.targets) > 2:
         plan.targets = plan.targets[:2]
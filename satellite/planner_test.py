@@ -0,0 +1,25 @@
+from satellite.planner import build_plan
+
+
+def _no_llm(**kwargs):
+    raise AssertionError("planner LLM should not be called")
+
+
+def test_skip_list_industry_never_calls_llm():
+    """Test that a skip-list industry (any case/whitespace) short-circuits before the LLM."""
+    plan = build_plan(_no_llm, "MSFT", " Software ")
+    assert plan.use_satellite is False
+    assert plan.targets == []
+    assert plan.notes == "Skipped due to industry."
+
+
+def test_no_industry_and_no_hints_never_calls_llm():
+    """Test that a call with nothing to plan from returns use_satellite=False locally."""
+    plan = build_plan(_no_llm, "XYZ", None)
+    assert plan.use_satellite is False
+
+
+if __name__ == "__main__":
+    test_skip_list_industry_never_calls_llm()
+    test_no_industry_and_no_hints_never_calls_llm()
+    print("✅ All tests passed.")
@@ -11,7 +11,8 @@ def run_satellite_module(
     ticker: str,
     industry: str,
     sites_db: Dict[str, list],
-    proxies_db: Dict[str, list]
+    proxies_db: Dict[str, list],
+    use_cache: bool = True,
 ) -> SatelliteSummary | dict:
     """
     High-level entry point: run the satellite pipeline for a given ticker/industry.
@@ -42,6 +43,10 @@ def run_satellite_module(
         Example: {"Agriculture": [{"name":"Ivory Coast cocoa belt","lat":7.6,"lon":-5.5,"radius_km":50.0}]}
         Can be empty if not used.
 
+    use_cache : bool
+        Reuse planner/summarizer LLM replies cached for identical inputs (24h TTL).
+        Pass False to force fresh LLM calls.
+
     Returns
     -------
     SatelliteSummary | dict
@@ -79,7 +84,8 @@ def run_satellite_module(
         ticker=ticker,
         industry=industry,
         site_hints=sites_db.get(ticker, []),
-        proxy_hints=proxies_db.get(industry, [])
+        proxy_hints=proxies_db.get(industry, []),
+        use_cache=use_cache,
     )
 
     # If planner says "not relevant", short-circuit with a trivial block
@@ -96,7 +102,7 @@ def run_satellite_module(
     result = execute_plan(plan)
 
     # 3) EXPLAIN: pass observations to LLM summarizer for human-readable summary
-    summary = summarize(llm_summarizer, ticker, industry, result)
+    summary = summarize(llm_summarizer, ticker, industry, result, use_cache=use_cache)
 
     # Return as dict so it can be merged into Strategist inputs easily
     return summary.model_dump()
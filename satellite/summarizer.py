@@ -1,5 +1,14 @@
+from typing import List
+from pydantic import BaseModel, Field
 from .schemas import ObservationResult, SatelliteSummary
-import json
+from tools.file_cache import FileCache
+
+# Raw summarizer JSON keyed on (prompts, ticker, industry, observations); 24h TTL.
+_summary_cache = FileCache("summarizer", ttl=24 * 3600)
+
+# Observations below this quality are dropped before the LLM sees them
+# (the system prompt asks for the same cut-off).
+MIN_QUALITY = 0.6
 
 # ---------------------------------------------------------------------------
 # Prompts
@@ -31,12 +40,43 @@ Return STRICT JSON:
   "attribution": ["S2"]
 }}"""
 
+# The prompts are fixed at import time, so digest them once for the cache key
+# instead of re-serializing ~1 KB of prompt text on every summarize() call.
+_PROMPTS_DIGEST = FileCache.make_key(SUMMARIZER_SYSTEM, SUMMARIZER_USER_TMPL)
+
+
+class _SummaryReply(BaseModel):
+    """The JSON object the summarizer LLM returns (SatelliteSummary minus the fields we fill in)."""
+    headline: str
+    bullets: List[str]
+    confidence: float = Field(..., ge=0.0, le=1.0)
+    attribution: List[str] = Field(default_factory=list)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 
-def summarize(llm, ticker: str, industry: str, result: ObservationResult) -> SatelliteSummary:
+def _slim_for_llm(result: ObservationResult) -> ObservationResult:
+    """
+    Copy of `result` holding only observations at or above MIN_QUALITY.
+    Dropped observations are noted as a gap so the LLM can still weigh coverage.
+    """
+    kept = [o for o in result.observations if o.quality >= MIN_QUALITY]
+    dropped = len(result.observations) - len(kept)
+    gaps = list(result.gaps)
+    if dropped:
+        gaps.append(f"{dropped} observation(s) below quality {MIN_QUALITY} dropped")
+    return ObservationResult(
+        ticker=result.ticker,
+        observations=kept,
+        gaps=gaps,
+        summary_notes=result.summary_notes,
+    )
+
+
+def summarize(llm, ticker: str, industry: str, result: ObservationResult, use_cache: bool = True) -> SatelliteSummary:
     """
     Summarize satellite observations into a SatelliteSummary.
 
@@ -57,6 +97,10 @@ def summarize(llm, ticker: str, industry: str, result: ObservationResult) -> Sat
         Structured output from the executor containing numeric observations,
         quality scores, and gap reasons.
 
+    use_cache : bool
+        Reuse the raw summary JSON for the same observations from the last 24h
+        instead of calling the LLM. Pass False to force a fresh summary.
+
     Returns
     -------
     SatelliteSummary
@@ -69,34 +113,75 @@ def summarize(llm, ticker: str, industry: str, result: ObservationResult) -> Sat
 
     Notes
     -----
-    - We serialize ObservationResult to JSON and feed it to the LLM.
-    - The LLM must return STRICT JSON; we parse it with json.loads.
+    - We serialize ObservationResult to JSON (model_dump_json) and feed it to the LLM,
+      keeping only observations with quality >= MIN_QUALITY and dropping provenance.
+    - raw_counts still reflect the full, unfiltered result.
+    - If no observation passes the quality cut, a zero-confidence summary listing
+      the gaps is returned without calling the LLM.
+    - The LLM must return STRICT JSON; it is parsed and validated in one step
+      (_SummaryReply.model_validate_json), so malformed replies raise and are never cached.
     - Any dropped observations (low quality) should not appear in the bullets.
     - The output is cautious: no hype, only evidence-based language.
     """
-    # Serialize ObservationResult → JSON string for LLM input
-    obs_json = json.dumps(result.model_dump(), ensure_ascii=False, indent=2)
-
-    # Fill the user template with context + observations
-    user = SUMMARIZER_USER_TMPL.format(
-        ticker=ticker,
-        industry=industry,
-        observations_json=obs_json
+    # Keep only observations the LLM should weigh (quality >= MIN_QUALITY)
+    slim = _slim_for_llm(result)
+
+    # Nothing usable (no observations, or all below MIN_QUALITY): there is no signal
+    # for the LLM to verify, so answer locally instead of paying for a round-trip
+    if not slim.observations:
+        return SatelliteSummary(
+            ticker=ticker,
+            headline=(
+                "Satellite data too low-quality to use." if result.observations
+                else "No satellite signal applicable."
+            ),
+            bullets=slim.gaps[:4],
+            confidence=0.0,
+            attribution=[],
+            raw_counts={
+                "observations": len(result.observations),
+                "gaps": len(result.gaps)
+            }
+        )
+
+    # Same numbers → same summary: key on the observations minus their run timestamps
+    cache_key = _summary_cache.make_key(
+        _PROMPTS_DIGEST, ticker, industry,
+        slim.model_dump(exclude={"observations": {"__all__": {"as_of", "provenance"}}}),
     )
-
-    # Call the LLM to produce a summary (must be STRICT JSON)
-    raw = llm(system=SUMMARIZER_SYSTEM, user=user)
-    data = json.loads(raw)
-
-    # Wrap in SatelliteSummary Pydantic model for downstream use
-    return SatelliteSummary(
+    raw = _summary_cache.get(cache_key) if use_cache else None
+    fresh = raw is None
+
+    # Call the LLM to produce a summary (must be STRICT JSON). The prompt is only built
+    # on a cache miss: the filtered result is serialized in one pydantic-core pass
+    # (UTF-8 kept), and provenance (bboxes, sample counts, debug metadata) is left out
+    # because it only costs tokens and leaks coordinates.
+    if fresh:
+        obs_json = slim.model_dump_json(indent=2, exclude={"observations": {"__all__": {"provenance"}}})
+        user = SUMMARIZER_USER_TMPL.format(
+            ticker=ticker,
+            industry=industry,
+            observations_json=obs_json
+        )
+        raw = llm(system=SUMMARIZER_SYSTEM, user=user)
+
+    # Parse + validate the reply in one pydantic-core pass; malformed replies raise here
+    reply = _SummaryReply.model_validate_json(raw)
+
+    # Wrap in SatelliteSummary for downstream use; every field is already validated
+    summary = SatelliteSummary.model_construct(
         ticker=ticker,
-        headline=data["headline"],
-        bullets=data["bullets"],
-        confidence=float(data["confidence"]),
-        attribution=list(data["attribution"]),
+        headline=reply.headline,
+        bullets=reply.bullets,
+        confidence=reply.confidence,
+        attribution=reply.attribution,
         raw_counts={
             "observations": len(result.observations),
             "gaps": len(result.gaps)
         }
     )
+
+    # Only cache replies that parsed into a valid summary
+    if fresh:
+        _summary_cache.set(cache_key, raw)
+    return summary
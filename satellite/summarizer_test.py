@@ -0,0 +1,64 @@
+import orjson
+import pytest
+from pydantic import ValidationError
+
+import satellite.summarizer as summarizer_module
+from satellite.schemas import Observation, ObservationResult
+from satellite.summarizer import summarize
+from tools.file_cache import FileCache
+
+REPLY = '{"headline": "h", "bullets": ["b"], "confidence": 0.7, "attribution": ["S2"]}'
+
+
+def _obs(quality: float) -> Observation:
+    return Observation(
+        target="Giga Austin", sensor="S2", metric="NDVI_mean_30d_vs_prev30d", value=4.2,
+        quality=quality, as_of="2025-01-01T00:00:00+00:00", provenance={"bbox": [-97.7, 30.1, -97.5, 30.3]},
+    )
+
+
+def test_llm_sees_only_quality_observations_without_provenance(monkeypatch, tmp_path):
+    """Test that low-quality rows and provenance are dropped from the prompt, but raw_counts stay complete."""
+    monkeypatch.setattr(summarizer_module, "_summary_cache", FileCache("summarizer", root=str(tmp_path)))
+    prompts = []
+
+    def llm(*, system, user):
+        prompts.append(user)
+        return REPLY
+
+    result = ObservationResult(ticker="TSLA", observations=[_obs(0.9), _obs(0.3)])
+    summary = summarize(llm, "TSLA", "Automotive", result)
+
+    sent = orjson.loads(prompts[0].split("Observations JSON:\n", 1)[1].split("\n\nReturn STRICT JSON", 1)[0])
+    assert [o["quality"] for o in sent["observations"]] == [0.9]
+    assert "provenance" not in sent["observations"][0]
+    assert sent["gaps"] == ["1 observation(s) below quality 0.6 dropped"]
+    assert summary.raw_counts == {"observations": 2, "gaps": 0}
+
+
+def test_invalid_reply_raises_and_is_not_cached(monkeypatch, tmp_path):
+    """Test that an out-of-range confidence is rejected at parse time and never reaches the cache."""
+    monkeypatch.setattr(summarizer_module, "_summary_cache", FileCache("summarizer", root=str(tmp_path)))
+    replies = iter(['{"headline": "h", "bullets": ["b"], "confidence": 1.5}', REPLY])
+    result = ObservationResult(ticker="TSLA", observations=[_obs(0.9)])
+
+    with pytest.raises(ValidationError):
+        summarize(lambda **_: next(replies), "TSLA", "Automotive", result)
+
+    summary = summarize(lambda **_: next(replies), "TSLA", "Automotive", result)
+    assert summary.confidence == 0.7
+    assert summary.attribution == ["S2"]
+
+
+def test_no_usable_observations_skips_llm():
+    """Test that empty or all-low-quality results are summarized locally, without an LLM call."""
+    def llm(**_):
+        raise AssertionError("summarizer LLM should not be called")
+
+    empty = summarize(llm, "MSFT", "Software", ObservationResult(ticker="MSFT", gaps=["No usable scenes"]))
+    assert empty.confidence == 0.0
+    assert empty.bullets == ["No usable scenes"]
+
+    noisy = summarize(llm, "TSLA", "Automotive", ObservationResult(ticker="TSLA", observations=[_obs(0.2)]))
+    assert noisy.headline == "Satellite data too low-quality to use."
+    assert noisy.raw_counts == {"observations": 1, "gaps": 0}
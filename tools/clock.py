@@ -0,0 +1,19 @@
+import time
+from datetime import date, datetime, timedelta
+
+_cached = {"until": 0.0, "val": ""}
+
+
+def today_str() -> str:
+    """
+    Today's local date as YYYY-MM-DD, computed once per day.
+    The cached string is reused until the next local midnight, so every agent
+    in a run (and every run on the same day) stamps the same date.
+    """
+    now = time.time()
+    if now >= _cached["until"]:
+        today = date.today()
+        midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        _cached["val"] = today.isoformat()
+        _cached["until"] = midnight.timestamp()
+    return _cached["val"]
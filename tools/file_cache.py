@@ -0,0 +1,67 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Optional
+
+CACHE_ROOT = os.getenv("HM_CACHE_DIR", ".cache")
+
+
+class FileCache:
+    """
+    Small TTL cache for string values (e.g. raw LLM JSON), in memory and on disk.
+
+    - Keys are blake2b digests of the inputs (see make_key), so raw inputs
+      never appear in file names.
+    - Entries live in an in-process dict and, unless set(..., persist=False),
+      in one file per key under <HM_CACHE_DIR or .cache>/<namespace>/.
+    - Writes are atomic (temp file + os.replace), so concurrent runs never
+      read a half-written entry.
+    - Expiry uses the write time; caching is best-effort and I/O errors are ignored.
+    """
+
+    def __init__(self, namespace: str, ttl: float = 24 * 3600, root: Optional[str] = None):
+        self.dir = os.path.join(root or CACHE_ROOT, namespace)
+        self.ttl = ttl
+        self._mem: dict[str, tuple[float, str]] = {}
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Stable digest of JSON-serializable parts (dict key order doesn't matter)."""
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        hit = self._mem.get(key)
+        if hit:
+            if now - hit[0] <= self.ttl:
+                return hit[1]
+            # Expired: drop it so the memory layer doesn't grow for the life of the process
+            del self._mem[key]
+
+        path = os.path.join(self.dir, key)
+        try:
+            written = os.path.getmtime(path)
+            if now - written > self.ttl:
+                return None
+            with open(path, encoding="utf-8") as f:
+                value = f.read()
+        except OSError:
+            return None
+        self._mem[key] = (written, value)
+        return value
+
+    def set(self, key: str, value: str, persist: bool = True) -> None:
+        self._mem[key] = (time.time(), value)
+        if not persist:
+            return
+        try:
+            os.makedirs(self.dir, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(value)
+            os.replace(tmp, os.path.join(self.dir, key))
+        except OSError:
+            pass
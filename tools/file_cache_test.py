@@ -0,0 +1,39 @@
+import os
+import time
+
+from tools.file_cache import FileCache
+
+
+def test_roundtrip_survives_new_instance(tmp_path):
+    """Test that a persisted entry is read back by a fresh cache (new process)."""
+    key = FileCache.make_key("TSLA", {"b": 1, "a": 2})
+    FileCache("planner", root=str(tmp_path)).set(key, '{"ok": true}')
+    assert FileCache("planner", root=str(tmp_path)).get(key) == '{"ok": true}'
+
+
+def test_key_ignores_dict_order():
+    """Test that make_key is stable across dict insertion order."""
+    assert FileCache.make_key({"a": 1, "b": 2}) == FileCache.make_key({"b": 2, "a": 1})
+    assert FileCache.make_key("TSLA", "EV") != FileCache.make_key("TSLA", "Auto")
+
+
+def test_expired_and_memory_only_entries(tmp_path):
+    """Test TTL expiry on disk and that persist=False never touches disk."""
+    cache = FileCache("summarizer", ttl=60, root=str(tmp_path))
+    cache.set("k", "v")
+    old = time.time() - 120
+    os.utime(os.path.join(cache.dir, "k"), (old, old))
+    assert FileCache("summarizer", ttl=60, root=str(tmp_path)).get("k") is None
+
+    cache.set("secret", "v", persist=False)
+    assert cache.get("secret") == "v"
+    assert not os.path.exists(os.path.join(cache.dir, "secret"))
+
+
+def test_expired_memory_entry_is_evicted(tmp_path):
+    """Test that an expired in-memory entry is dropped instead of kept forever."""
+    cache = FileCache("summarizer", ttl=60, root=str(tmp_path))
+    cache.set("k", "v", persist=False)
+    cache._mem["k"] = (time.time() - 120, "v")
+    assert cache.get("k") is None
+    assert "k" not in cache._mem
@@ -1,19 +1,23 @@
-import matplotlib.pyplot as plt
-import yfinance as yf
+from matplotlib.figure import Figure
+import numpy as np
 import pandas as pd
 from typing import Optional
+from tools.yahoo_finance import get_history
+import fnmatch
 import os
-import glob
 
 
 class FinanceVisualizer:
     """
     Generate financial charts for multi-modal analysis.
-    Methods produce PNG files given a stock ticker and optional related data.
+    draw_* methods return a matplotlib Figure given a stock ticker and optional
+    related data; render it in memory or write it to disk with save().
+
+    Each chart is drawn on its own Figure (no pyplot global state),
+    so the draw_* methods are safe to call from concurrent threads.
     """
 
     def __init__(self, outdir: str = "charts"):
-        os.makedirs(outdir, exist_ok=True)
         self.outdir = outdir
 
     # --------------------------------------------------------
@@ -22,12 +26,18 @@ class FinanceVisualizer:
     def draw_price_with_insiders(
         self, symbol: str, insiders_df: Optional[pd.DataFrame] = None,
         period: str = "1y"
-    ) -> str:
-        stock = yf.Ticker(symbol)
-        hist = stock.history(period=period)
-        fig, ax = plt.subplots(figsize=(10, 5))
+    ) -> Figure:
+        hist = get_history(symbol, period=period)
+        fig = Figure(figsize=(10, 5))
+        ax = fig.subplots()
         ax.plot(hist.index, hist["Close"], label="Close Price", color="blue")
 
+        if insiders_df is not None and not insiders_df.empty and not hist.empty:
+            # Keep only trades inside the plotted price window; older ones would stretch the
+            # date axis. Yahoo's index is exchange-local tz-aware, insider dates are naive.
+            idx = hist.index.tz_localize(None) if hist.index.tz is not None else hist.index
+            insiders_df = insiders_df[insiders_df["startDate"].between(idx[0].normalize(), idx[-1])]
+
         if insiders_df is not None and not insiders_df.empty:
             buys = insiders_df[insiders_df["transaction"] == "Buy"]
             sells = insiders_df[insiders_df["transaction"] == "Sale"]
@@ -40,56 +50,56 @@ class FinanceVisualizer:
         ax.legend()
         ax.grid(True, linestyle="--", alpha=0.5)
         fig.autofmt_xdate()
-
-        outfile = f"{self.outdir}/{symbol}_price_insiders.png"
-        plt.savefig(outfile, bbox_inches="tight")
-        plt.close(fig)
-        return outfile
+        return fig
 
     # --------------------------------------------------------
     # 2. Quarterly revenue vs. net income
     # --------------------------------------------------------
     def draw_quarterly_revenue_income(
         self, symbol: str, qdf: pd.DataFrame
-    ) -> str:
-        if qdf is None or qdf.empty:
-            return ""
-
-        fig, ax = plt.subplots(figsize=(10, 5))
-        quarters = [d.strftime("%Y-%m") for d in qdf.index]
+    ) -> Optional[Figure]:
+        # No statements (empty frame) or no revenue/net income lines: nothing to draw
+        if qdf is None or len(qdf) == 0 or "Revenue" not in qdf or "NetIncome" not in qdf:
+            return None
+
+        # Pull plain arrays once; matplotlib doesn't need the pandas wrappers
+        quarters = qdf.index.strftime("%Y-%m").to_numpy()
+        revenue = qdf["Revenue"].to_numpy(dtype=float)
+        net_income = qdf["NetIncome"].to_numpy(dtype=float)
+
+        fig = Figure(figsize=(10, 5))
+        ax = fig.subplots()
+        xs = np.arange(quarters.size)
         width = 0.35
 
-        ax.bar([i - width/2 for i in range(len(qdf))], qdf["Revenue"], width, label="Revenue")
-        ax.bar([i + width/2 for i in range(len(qdf))], qdf["NetIncome"], width, label="Net Income")
+        ax.bar(xs - width/2, revenue, width, label="Revenue")
+        ax.bar(xs + width/2, net_income, width, label="Net Income")
 
-        ax.set_xticks(range(len(qdf)))
+        ax.set_xticks(xs)
         ax.set_xticklabels(quarters, rotation=45)
         ax.set_title(f"{symbol} Quarterly Revenue vs Net Income")
         ax.set_ylabel("USD")
         ax.legend()
         ax.grid(True, linestyle="--", alpha=0.5)
-
-        outfile = f"{self.outdir}/{symbol}_quarterly_revenue_income.png"
-        plt.savefig(outfile, bbox_inches="tight")
-        plt.close(fig)
-        return outfile
+        return fig
 
     # --------------------------------------------------------
     # 3. Relative performance vs benchmark
     # --------------------------------------------------------
     def draw_relative_performance(
         self, symbol: str, benchmark: str = "SPY", period: str = "1y"
-    ) -> str:
-        stock = yf.Ticker(symbol)
-        bench = yf.Ticker(benchmark)
-        hist_s = stock.history(period=period)["Close"]
-        hist_b = bench.history(period=period)["Close"]
+    ) -> Figure:
+        # Both series come from the shared history cache (the symbol's was
+        # usually already loaded by the fundamentals price trend)
+        hist_s = get_history(symbol, period=period)["Close"]
+        hist_b = get_history(benchmark, period=period)["Close"]
 
         # Normalize both to 100 at start
         norm_s = (hist_s / hist_s.iloc[0]) * 100
         norm_b = (hist_b / hist_b.iloc[0]) * 100
 
-        fig, ax = plt.subplots(figsize=(10, 5))
+        fig = Figure(figsize=(10, 5))
+        ax = fig.subplots()
         ax.plot(norm_s.index, norm_s, label=symbol, color="blue")
         ax.plot(norm_b.index, norm_b, label=benchmark, color="gray", linestyle="--")
 
@@ -98,10 +108,25 @@ class FinanceVisualizer:
         ax.legend()
         ax.grid(True, linestyle="--", alpha=0.5)
         fig.autofmt_xdate()
+        return fig
 
-        outfile = f"{self.outdir}/{symbol}_relative_perf.png"
-        plt.savefig(outfile, bbox_inches="tight")
-        plt.close(fig)
+    # --------------------------------------------------------
+    # Output helpers
+    # --------------------------------------------------------
+    def save(self, fig: Figure, filename: str) -> str:
+        """
+        Write a chart to a PNG file in the output directory.
+
+        Args:
+            fig: Figure returned by one of the draw_* methods
+            filename: file name inside outdir (e.g. "TSLA_relative_perf.png")
+
+        Returns:
+            Path of the written file.
+        """
+        os.makedirs(self.outdir, exist_ok=True)
+        outfile = os.path.join(self.outdir, filename)
+        fig.savefig(outfile, bbox_inches="tight")
         return outfile
 
     # --------------------------------------------------------
@@ -114,10 +139,19 @@ class FinanceVisualizer:
         Args:
             pattern: glob pattern for files to delete (default: all PNGs)
         """
-        files = glob.glob(os.path.join(self.outdir, pattern))
-        for f in files:
-            try:
-                os.remove(f)
-            except Exception as e:
-                print(f"⚠️ Failed to remove {f}: {e}")
-        print(f"🗑️ Cleared {len(files)} image(s) from {self.outdir}")
+        # One directory scan; DirEntry carries the type and full path, no per-file re-stat/join
+        count = 0
+        try:
+            with os.scandir(self.outdir) as entries:
+                for entry in entries:
+                    # Like glob, a wildcard never matches dotfiles
+                    if entry.name.startswith(".") or not fnmatch.fnmatch(entry.name, pattern) or not entry.is_file():
+                        continue
+                    try:
+                        os.unlink(entry.path)
+                        count += 1
+                    except OSError as e:
+                        print(f"⚠️ Failed to remove {entry.path}: {e}")
+        except FileNotFoundError:
+            pass
+        print(f"🗑️ Cleared {count} image(s) from {self.outdir}")
@@ -1,5 +1,6 @@
 # test_finance_visualizer.py
 
+import pandas as pd
 import yfinance as yf
 from tools.yahoo_finance import extract_insider_transactions, extract_quarterly_earnings
 from tools.finance_visualizer import FinanceVisualizer
@@ -22,24 +23,37 @@ def test_generate_images(symbol: str = "PLTR"):
     print(insiders.head())
     print(insiders.columns)
 
-    img1 = viz.draw_price_with_insiders(symbol, insiders)
+    img1 = viz.save(viz.draw_price_with_insiders(symbol, insiders), f"{symbol}_price_insiders.png")
     print(f"✅ Price + Insider chart saved: {img1}")
 
     # 2. Quarterly revenue vs net income
     qdf = extract_quarterly_earnings(stock, max_quarters=8)
     if not qdf.empty:
-        img2 = viz.draw_quarterly_revenue_income(symbol, qdf)
+        img2 = viz.save(viz.draw_quarterly_revenue_income(symbol, qdf), f"{symbol}_quarterly_revenue_income.png")
         print(f"✅ Quarterly Revenue vs Net Income chart saved: {img2}")
     else:
         print("⚠️ No quarterly earnings data available for this ticker.")
 
     # 3. Relative performance vs SPY
-    img3 = viz.draw_relative_performance(symbol, benchmark="SPY")
+    img3 = viz.save(viz.draw_relative_performance(symbol, benchmark="SPY"), f"{symbol}_relative_perf.png")
     print(f"✅ Relative Performance chart saved: {img3}")
 
     print("=" * 60)
     print("📝 Open the generated PNGs in the charts/ folder to verify manually.\n")
 
 
+def test_quarterly_chart_skips_missing_data():
+    """Test that no chart (rather than an error) comes back for empty or incomplete statements."""
+    viz = FinanceVisualizer()
+    assert viz.draw_quarterly_revenue_income("SPY", pd.DataFrame()) is None
+
+    idx = pd.to_datetime(["2024-03-31", "2024-06-30"])
+    no_revenue = pd.DataFrame({"NetIncome": [1.0, 2.0]}, index=idx)
+    assert viz.draw_quarterly_revenue_income("SPY", no_revenue) is None
+
+    full = no_revenue.assign(Revenue=[10.0, 20.0])
+    assert viz.draw_quarterly_revenue_income("SPY", full) is not None
+
+
 if __name__ == "__main__":
     test_generate_images("PLTR")
@@ -1,7 +1,15 @@
-import finnhub
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
-load_dotenv()
 
-finnhub_client = finnhub.Client(api_key=os.getenv("FINNHUB_API_KEY"))
+@lru_cache(maxsize=1)
+def get_finnhub_client():
+    """
+    Shared Finnhub client, built on first use so importing this module
+    neither loads the SDK nor reads FINNHUB_API_KEY.
+    """
+    import finnhub
+
+    load_dotenv()
+    return finnhub.Client(api_key=os.getenv("FINNHUB_API_KEY"))
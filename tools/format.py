@@ -1,24 +1,27 @@
+from functools import lru_cache
 
-def format_box(lines: list[str], width: int = 80, padding: int = 2) -> str:
+
+@lru_cache(maxsize=256)
+def format_box(lines: tuple[str, ...], width: int = 80, padding: int = 2) -> str:
     """
-    Formats a list of text lines into a centered, padded box of fixed width.
+    Formats a tuple of text lines into a centered, padded box of fixed width.
+    Results are memoized: report headers repeat per (symbol, date) across agents.
 
     Args:
-        lines (list[str]): Lines of text to center inside the box.
+        lines (tuple[str, ...]): Lines of text to center inside the box (a tuple, so it is hashable).
         width (int): Total width of the box (including borders).
         padding (int): Spaces between border and text.
 
     Returns:
         str: A string representation of the formatted box.
     """
-    box = []
     horizontal = "=" * width
-    box.append(horizontal)
-
-    for line in lines:
-        content_width = width - 2 * padding - 2  # 2 for border pipes
-        centered_line = line.center(content_width)
-        box.append(f"{' ' * padding}|{centered_line}|")
+    pad = " " * padding
+    content_width = width - 2 * padding - 2  # 2 for border pipes
 
-    box.append(horizontal)
-    return "\n".join(box)
+    # str.center (not "{:^n}") keeps the existing split of odd padding
+    return "\n".join((
+        horizontal,
+        *(f"{pad}|{line.center(content_width)}|" for line in lines),
+        horizontal,
+    ))
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta, UTC
-from tools.finnhub_client import finnhub_client
+from itertools import islice
+from tools.finnhub_client import get_finnhub_client
 
 
 def fetch_news_articles(symbol: str, max_articles: int = 5, days_ago: int = 7):
@@ -17,24 +18,22 @@ def fetch_news_articles(symbol: str, max_articles: int = 5, days_ago: int = 7):
     to_date = datetime.now(UTC).date()
     from_date = to_date - timedelta(days=days_ago)
 
-    response = finnhub_client.company_news(
+    response = get_finnhub_client().company_news(
         symbol,
         _from=from_date.strftime("%Y-%m-%d"),
         to=to_date.strftime("%Y-%m-%d"),
     )
 
-    articles = []
-    for item in response:
-        if not item.get("summary"):
-            continue
-        articles.append({
+    # Lazily skip summary-less items and stop at max_articles: only the kept
+    # few are ever built/date-formatted, however many items Finnhub returns
+    with_summary = (item for item in response if item.get("summary"))
+    return [
+        {
             "title": item["headline"],
             "summary": item["summary"],
             "source": item.get("source", ""),
             "url": item["url"],
             "published": datetime.fromtimestamp(item["datetime"], UTC).strftime("%Y-%m-%d %H:%M:%S"),
-        })
-        if len(articles) >= max_articles:
-            break
-
-    return articles
+        }
+        for item in islice(with_summary, max_articles)
+    ]
@@ -1,19 +1,27 @@
-import praw
 from datetime import datetime, timedelta, UTC
+from functools import lru_cache
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
 
-reddit = praw.Reddit(
-    client_id=os.getenv("REDDIT_CLIENT_ID"),
-    client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-    user_agent="StockInsightAI/1.0"
-)
+@lru_cache(maxsize=1)
+def get_reddit():
+    """
+    Shared read-only Reddit client, built on first use so importing this
+    module neither loads praw nor requires the REDDIT_* credentials.
+    """
+    import praw
+
+    load_dotenv()
+    return praw.Reddit(
+        client_id=os.getenv("REDDIT_CLIENT_ID"),
+        client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
+        user_agent="StockInsightAI/1.0"
+    )
 
 
 def search_posts_by_ticker(
-    subreddits: list,
+    subreddits: list | tuple,
     ticker: str,
     days_back: int = 7,
     limit: int = 500
@@ -22,7 +30,7 @@ def search_posts_by_ticker(
     Search recent Reddit posts that mention a stock ticker.
 
     Args:
-        subreddits (list): List of subreddit names (e.g., ['wallstreetbets']).
+        subreddits (list | tuple): Subreddit names (e.g., ['wallstreetbets']).
         ticker (str): Stock ticker to search for.
         days_back (int): Time window to filter posts.
         limit (int): Number of posts to retrieve per subreddit.
@@ -34,13 +42,16 @@ def search_posts_by_ticker(
     start_time = end_time - timedelta(days=days_back)
 
     matched_posts = []
+    reddit = get_reddit()
 
     for subreddit_name in subreddits:
         subreddit = reddit.subreddit(subreddit_name)
         query = ticker
         for submission in subreddit.search(query, sort="new", limit=limit):
             post_time = datetime.fromtimestamp(submission.created_utc, UTC).date()
-            if start_time <= post_time <= end_time:
+            if post_time < start_time:
+                break  # results are newest-first, so the rest are older still
+            if post_time <= end_time:
                 if submission.selftext.lower() in ["[removed]", "[deleted]"]:
                     continue  # skip removed content
                 matched_posts.append({
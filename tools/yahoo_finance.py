@@ -1,19 +1,83 @@
 import yfinance as yf
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+import re
+import threading
+import time
+import orjson
 import pandas as pd
 import numpy as np
 from typing import Dict, Any, List, Optional
+from tools.clock import today_str
+from tools.file_cache import FileCache
 
+# One Ticker per symbol shared by every caller for a few minutes: symbol -> (created_at, Ticker).
+# yfinance memoizes .info, statements and the insider table on the Ticker itself.
+_TICKER_TTL = 300
+_tickers: Dict[str, tuple] = {}
+_ticker_guard = threading.Lock()
 
-def get_fundamentals(symbol: str) -> dict:
-    stock = yf.Ticker(symbol)
-    info = stock.info
-    price_trend = get_historical_prices(symbol)
+# Ticker.info (the slowest Yahoo call) persisted across runs, under .cache/yf/info/
+_info_cache = FileCache("yf/info", ttl=3600)
+
+# Ticker.insider_transactions persisted for the day (filings land at most daily)
+_insider_disk = FileCache("yf/insider_transactions", ttl=24 * 3600)
+
+# Price history shared across callers for a few minutes: (symbol, period) -> (fetched_at, DataFrame)
+_HISTORY_TTL = 300
+_history_cache: Dict[tuple, tuple] = {}
+# ...and persisted across runs for an hour, as typed columnar JSON under .cache/yf/history/
+_history_disk = FileCache("yf/history", ttl=3600)
+_history_locks: Dict[tuple, threading.Lock] = {}
+_history_guard = threading.Lock()
+
+# Symbols per yf.download request in get_history_many
+_DOWNLOAD_CHUNK = 20
+
+# Row labels that mark a statement as metrics-on-index (needs transposing)
+_METRIC_LABEL = re.compile("Revenue|Income|EPS|Profit")
+
+
+def get_ticker(symbol: str) -> yf.Ticker:
+    """
+    Shared yf.Ticker for `symbol`, reused for _TICKER_TTL seconds so standalone
+    agents in one run (fundamentals, earnings, insiders, charts) hit Yahoo once
+    per endpoint instead of once per agent.
+    """
+    now = time.monotonic()
+    with _ticker_guard:
+        hit = _tickers.get(symbol)
+        if hit and now - hit[0] < _TICKER_TTL:
+            return hit[1]
+        stock = yf.Ticker(symbol)
+        _tickers[symbol] = (now, stock)
+        return stock
+
+
+def get_info(symbol: str, stock: Optional[yf.Ticker] = None) -> dict:
+    """Ticker.info for `symbol`, served from the on-disk cache when fetched within the last hour."""
+    key = _info_cache.make_key(symbol)
+    raw = _info_cache.get(key)
+    if raw is not None:
+        return orjson.loads(raw)
+    info = (stock or get_ticker(symbol)).info or {}
+    if info:
+        _info_cache.set(key, orjson.dumps(info, default=str).decode())
+    return info
+
+
+def get_fundamentals(symbol: str, stock: Optional[yf.Ticker] = None,
+                     price_trend: Optional[dict] = None) -> dict:
+    """Pass `price_trend` (e.g. from get_historical_prices_many) to skip the per-symbol history lookup."""
+    stock = stock or get_ticker(symbol)
+    info = get_info(symbol, stock)
+    if price_trend is None:
+        price_trend = get_historical_prices(symbol, stock=stock)
 
     return {
         "symbol": symbol,
         "industry": info.get('industry'),
-        "date": datetime.today().strftime("%Y-%m-%d"),
+        "date": today_str(),
         "marketCap": info.get("marketCap"),
         "forwardPE": info.get("forwardPE"),
         "revenueGrowth": info.get("revenueGrowth"),
@@ -25,17 +89,168 @@ def get_fundamentals(symbol: str) -> dict:
     }
 
 
-def get_historical_prices(symbol: str, period: str = "1y") -> dict:
-    stock = yf.Ticker(symbol)
-    hist = stock.history(period=period)
-    closing_prices = hist["Close"]
+def get_history(symbol: str, period: str = "1y", stock: Optional[yf.Ticker] = None) -> pd.DataFrame:
+    """
+    Daily price history for (symbol, period), downloaded once and reused for
+    _HISTORY_TTL seconds by every caller (fundamentals price trend, price and
+    relative-performance charts, the SPY benchmark across tickers), and for an
+    hour by later runs on the same day via the on-disk copy.
+    Concurrent callers for the same key wait for a single download.
+    The returned DataFrame is shared: treat it as read-only.
+    """
+    key = (symbol, period)
+    with _history_guard:
+        lock = _history_locks.setdefault(key, threading.Lock())
+    with lock:
+        hist = _cached_history(key)
+        if hist is not None:
+            return hist
+        hist = (stock or get_ticker(symbol)).history(period=period)
+        if not hist.empty:
+            _store_history(key, hist)
+        return hist
+
+
+def _cached_history(key: tuple) -> Optional[pd.DataFrame]:
+    """History for (symbol, period) from memory, else from today's on-disk copy; None on a miss."""
+    hit = _history_cache.get(key)
+    if hit and time.monotonic() - hit[0] < _HISTORY_TTL:
+        return hit[1]
+    raw = _history_disk.get(_history_disk.make_key(*key, today_str()))
+    if raw is None:
+        return None
+    try:
+        hist = _frame_from_json(raw)
+    except Exception:
+        return None  # an entry we can't rebuild is a miss; the refetch overwrites it
+    _history_cache[key] = (time.monotonic(), hist)
+    return hist
+
+
+def _store_history(key: tuple, hist: pd.DataFrame) -> None:
+    _history_cache[key] = (time.monotonic(), hist)
+    try:
+        _history_disk.set(_history_disk.make_key(*key, today_str()), _frame_to_json(hist))
+    except TypeError:
+        pass  # a cell orjson can't encode; just don't persist this one
+
+
+def _frame_to_json(df: pd.DataFrame) -> str:
+    """
+    Serialize a Yahoo table (price history, insider transactions) column by
+    column with its dtypes, so _frame_from_json rebuilds it without any type
+    inference. A DatetimeIndex is stored as epoch nanoseconds plus its timezone
+    (any other index comes back as a RangeIndex), datetime columns as int64
+    ticks, and NaN as null.
+    """
+    index = df.index if isinstance(df.index, pd.DatetimeIndex) else None
+    return orjson.dumps({
+        "index": index.asi8 if index is not None else None,
+        "tz": str(index.tz) if index is not None and index.tz is not None else None,
+        "name": df.index.name,
+        "columns": [[c, str(df[c].dtype), _column_payload(df[c].to_numpy())] for c in df.columns],
+    }, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def _column_payload(values: np.ndarray):
+    # orjson writes numeric arrays natively; datetimes go as int64 ticks (NaT included),
+    # object columns (text) as plain lists
+    if values.dtype.kind == "M":
+        return values.view("i8")
+    if values.dtype == object:
+        return values.tolist()
+    return values
+
+
+def _frame_from_json(raw: str) -> pd.DataFrame:
+    obj = orjson.loads(raw)
+    index = None
+    if obj["index"] is not None:
+        index = pd.DatetimeIndex(np.array(obj["index"], dtype="datetime64[ns]"), name=obj["name"])
+        if obj["tz"]:
+            index = index.tz_localize("UTC").tz_convert(obj["tz"])
+    # float(None) is NaN, so nulls come back as NaN in float columns (None in object ones)
+    return pd.DataFrame(
+        {
+            name: (np.array(values, dtype="int64").view(dtype) if dtype.startswith("datetime64")
+                   else np.array(values, dtype=dtype))
+            for name, dtype, values in obj["columns"]
+        },
+        index=index,
+    )
+
+
+def get_history_many(symbols: List[str], period: str = "1y") -> Dict[str, pd.DataFrame]:
+    """
+    Daily price history for several symbols, downloaded with one yf.download
+    request per _DOWNLOAD_CHUNK symbols instead of one request per symbol.
+    Results go into the shared history cache, so later get_history() calls
+    (fundamentals, charts) for these symbols don't hit Yahoo again.
+    Each frame is on its symbol's own exchange timezone, as from Ticker.history.
+    Symbols Yahoo returns nothing for are left out.
+    """
+    out: Dict[str, pd.DataFrame] = {}
+    missing = []
+    for symbol in dict.fromkeys(symbols):
+        hist = _cached_history((symbol, period))
+        if hist is not None:
+            out[symbol] = hist
+        else:
+            missing.append(symbol)
+
+    for i in range(0, len(missing), _DOWNLOAD_CHUNK):
+        chunk = missing[i:i + _DOWNLOAD_CHUNK]
+        # Same shape as Ticker.history: tz-aware index, dividend/split columns
+        df = yf.download(chunk, period=period, group_by="ticker", actions=True,
+                         ignore_tz=False, threads=True, progress=False)
+        if df is None or df.empty:
+            continue
+        fetched = set(df.columns.get_level_values(0))
+        for symbol in chunk:
+            if symbol not in fetched:
+                continue
+            # yf.download puts every symbol on the batch's most common exchange timezone
+            # (7203.T next to SPY lands on New York time, a day early); move it back
+            tz = _exchange_tz(symbol)
+            if tz is None:
+                hist = get_history(symbol, period=period)
+            else:
+                # The index is the union of all symbols' trading days; keep this symbol's own
+                hist = df[symbol].tz_convert(tz)
+                hist = hist[hist["Close"].notna()]
+                if not hist.empty:
+                    _store_history((symbol, period), hist)
+            if not hist.empty:
+                out[symbol] = hist
+    return out
+
+
+def _exchange_tz(symbol: str) -> Optional[str]:
+    """The symbol's exchange timezone (what Ticker.history indexes by), or None when Yahoo doesn't say."""
+    try:
+        return get_info(symbol).get("exchangeTimezoneName")
+    except Exception:
+        return None
+
+
+def get_historical_prices_many(symbols: List[str], period: str = "1y") -> Dict[str, dict]:
+    """get_historical_prices for several symbols, backed by one batched download (see get_history_many)."""
+    hists = get_history_many(symbols, period=period)
+    return {symbol: get_historical_prices(symbol, period=period) for symbol in hists}
+
+
+def get_historical_prices(symbol: str, period: str = "1y", stock: Optional[yf.Ticker] = None) -> dict:
+    hist = get_history(symbol, period=period, stock=stock)
+    # Two scalars out of the raw array as Python floats; no positional-indexer dispatch
+    closes = hist["Close"].to_numpy()
+    start, end = float(closes[0]), float(closes[-1])
 
     return {
-        "start_date": closing_prices.index[0].strftime("%Y-%m-%d"),
-        "end_date": closing_prices.index[-1].strftime("%Y-%m-%d"),
-        "start_price": round(closing_prices.iloc[0], 2),
-        "end_price": round(closing_prices.iloc[-1], 2),
-        "percent_change": round(((closing_prices.iloc[-1] - closing_prices.iloc[0]) / closing_prices.iloc[0]) * 100, 2)
+        "start_date": hist.index[0].strftime("%Y-%m-%d"),
+        "end_date": hist.index[-1].strftime("%Y-%m-%d"),
+        "start_price": round(start, 2),
+        "end_price": round(end, 2),
+        "percent_change": round((end - start) / start * 100, 2)
     }
 
 
@@ -64,33 +279,52 @@ def extract_quarterly_earnings(stock: yf.Ticker, max_quarters: int = 8) -> pd.Da
 
     out = pd.DataFrame(index=df.index)
     if revenue_key is not None:
-        out["Revenue"] = pd.to_numeric(df[revenue_key], errors="coerce")
+        out["Revenue"] = _to_numeric(df[revenue_key])
     if netinc_key is not None:
-        out["NetIncome"] = pd.to_numeric(df[netinc_key], errors="coerce")
+        out["NetIncome"] = _to_numeric(df[netinc_key])
 
     # Prefer reported diluted EPS; else derive = NetIncome / DilutedShares
     if eps_dil_key is not None:
-        out["EPS_Diluted"] = pd.to_numeric(df[eps_dil_key], errors="coerce")
+        out["EPS_Diluted"] = _to_numeric(df[eps_dil_key])
     elif netinc_key is not None and dil_shrs_key is not None:
-        ni = pd.to_numeric(df[netinc_key], errors="coerce")
-        sh = pd.to_numeric(df[dil_shrs_key], errors="coerce")
+        ni = _to_numeric(df[netinc_key])
+        sh = _to_numeric(df[dil_shrs_key])
         out["EPS_Diluted"] = ni / sh
 
-    out = out.dropna(how="all")
+    # Drop all-empty quarters and keep the last `max_quarters` in one positional slice
+    keep = np.flatnonzero(pd.notna(out.to_numpy()).any(axis=1))
     if max_quarters:
-        out = out.tail(max_quarters)
-    return out
+        keep = keep[-max_quarters:]
+    return out.iloc[keep]
+
+
+def _insider_table(stock: yf.Ticker) -> Optional[pd.DataFrame]:
+    """Ticker.insider_transactions, served from today's on-disk copy when there is one."""
+    key = _insider_disk.make_key(stock.ticker, today_str())
+    raw = _insider_disk.get(key)
+    if raw is not None:
+        try:
+            return _frame_from_json(raw)
+        except Exception:
+            pass  # an entry we can't rebuild is a miss; the refetch overwrites it
+    df = getattr(stock, "insider_transactions", None)
+    if isinstance(df, pd.DataFrame) and not df.empty:
+        try:
+            _insider_disk.set(key, _frame_to_json(df))
+        except TypeError:
+            pass  # a cell orjson can't encode; just don't persist this one
+    return df
 
 
 def extract_insider_transactions(stock: yf.Ticker, last_n: int = 10):
     try:
-        info = stock.info or {}
+        info = get_info(stock.ticker, stock)
         if str(info.get("quoteType")).upper() == "ETF":
             return None
     except Exception:
         pass
 
-    raw = getattr(stock, "insider_transactions", None)
+    raw = _insider_table(stock)
     if not isinstance(raw, pd.DataFrame) or raw.empty:
         return None
 
@@ -98,14 +332,30 @@ def extract_insider_transactions(stock: yf.Ticker, last_n: int = 10):
     if df.empty:
         return None
 
+    # The normalizer already made transaction labels strings and the share/value
+    # columns numeric, so these are plain reductions (_to_numeric only guards all-None columns)
     summary = {
-        "by_type_counts": df["transaction"].astype(str).value_counts(dropna=False).to_dict(),
-        "net_shares": pd.to_numeric(df["signed_shares"], errors="coerce").sum(),
-        "total_value": pd.to_numeric(df["value"], errors="coerce").sum(),
+        "by_type_counts": df["transaction"].value_counts(dropna=False).to_dict(),
+        "net_shares": _to_numeric(df["signed_shares"]).sum(),
+        "total_value": _to_numeric(df["value"]).sum(),
     }
     return df.tail(last_n), summary
 
 
+def _to_numeric(s):
+    """pd.to_numeric(s, errors="coerce"), skipping the parse when `s` already has a numeric dtype."""
+    if s is not None and pd.api.types.is_numeric_dtype(s):
+        return s
+    return pd.to_numeric(s, errors="coerce")
+
+
+def _to_datetime(x):
+    """pd.to_datetime(x, errors="coerce"), skipping the parse when `x` is already datetime64."""
+    if pd.api.types.is_datetime64_any_dtype(x):
+        return x
+    return pd.to_datetime(x, errors="coerce")
+
+
 def _to_float(x) -> Optional[float]:
     try:
         v = float(x)
@@ -116,20 +366,8 @@ def _to_float(x) -> Optional[float]:
         return None
 
 
-def _iso(d) -> Optional[str]:
-    if pd.isna(d) or d is None:
-        return None
-    if isinstance(d, (pd.Timestamp, )):
-        return d.date().isoformat()
-    if hasattr(d, "isoformat"):
-        return d.isoformat()
-    # try parse
-    try:
-        return pd.to_datetime(d).date().isoformat()
-    except Exception:
-        return None
-
-
+# Yahoo repeats a handful of transaction/text strings, so classify each distinct one once
+@lru_cache(maxsize=4096)
 def _standardize_tx_type(s: str) -> str:
     if not s:
         return ""
@@ -158,8 +396,6 @@ def normalize_insider_transactions_df_basic(df: pd.DataFrame) -> pd.DataFrame:
             "ownership","position","url","text","signed_shares"
         ])
 
-    d = df.copy()
-
     # Map uppercase/spacey -> canonical lowercase keys commonly seen
     rename_map = {
         "Start Date": "startDate",
@@ -172,22 +408,26 @@ def normalize_insider_transactions_df_basic(df: pd.DataFrame) -> pd.DataFrame:
         "URL": "url",
         "Text": "text",
     }
-    for old, new in rename_map.items():
-        if old in d.columns and new not in d.columns:
-            d = d.rename(columns={old: new})
+    # One rename into a new frame that shares the caller's column data: every step
+    # below assigns whole columns (never writes into existing ones), so the
+    # caller's DataFrame (often yfinance's memoized table) is left untouched
+    d = df.rename(columns={
+        old: new for old, new in rename_map.items()
+        if old in df.columns and new not in df.columns
+    }, copy=False)
 
     # Dates
     if "startDate" in d.columns:
         if pd.api.types.is_numeric_dtype(d["startDate"]):
             d["startDate"] = pd.to_datetime(d["startDate"], unit="s", utc=True).dt.tz_convert(None)
         else:
-            d["startDate"] = pd.to_datetime(d["startDate"], errors="coerce")
+            d["startDate"] = _to_datetime(d["startDate"])
 
     # Numerics
     if "shares" in d.columns:
-        d["shares"] = pd.to_numeric(d["shares"], errors="coerce")
+        d["shares"] = _to_numeric(d["shares"])
     if "value" in d.columns:
-        d["value"] = pd.to_numeric(d["value"], errors="coerce")
+        d["value"] = _to_numeric(d["value"])
 
     # Price: derive from value / abs(shares) when both exist (avoid negative prices)
     d["price"] = np.nan
@@ -205,7 +445,7 @@ def normalize_insider_transactions_df_basic(df: pd.DataFrame) -> pd.DataFrame:
         d["transaction"] = d["text"].map(_extract_tx_type_from_text)
 
     # signed_shares: Buys positive, Sales negative (only flip if positive)
-    d["signed_shares"] = pd.to_numeric(d.get("shares"), errors="coerce")
+    d["signed_shares"] = _to_numeric(d.get("shares"))
     mask_sale = (d.get("transaction") == "Sale") & d["signed_shares"].gt(0)
     d.loc[mask_sale, "signed_shares"] = -d.loc[mask_sale, "signed_shares"]
 
@@ -215,39 +455,38 @@ def normalize_insider_transactions_df_basic(df: pd.DataFrame) -> pd.DataFrame:
         if k not in d.columns:
             d[k] = None
 
-    return d[keep].sort_values("startDate", na_position="last")
+    # Sort first, then select: one frame copy instead of two
+    return d.sort_values("startDate", na_position="last")[keep]
 
 
 def _add_growth_cols(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
     """
     Add QoQ (shift=1) and YoY (shift=4) growth for each metric in `cols`.
-    Uses pct_change (no deprecated options). Any division-by-zero produces
-    ±inf which we convert to NA explicitly.
+    All metrics are divided in one NumPy pass over the numeric block; a missing
+    quarter carries the previous value forward (pct_change's "pad" fill).
+    Any division-by-zero produces ±inf, which we convert to NaN explicitly.
     """
-    out = df.copy()
-    out.index = pd.to_datetime(out.index, errors="coerce")
-    out = out.sort_index()
-
-    for c in cols:
-        if c not in out.columns:
-            continue
-        s = pd.to_numeric(out[c], errors="coerce")
-
-        # QoQ and YoY growth
-        qoq = s.pct_change(periods=1)
-        yoy = s.pct_change(periods=4)
-
-        # Replace ±inf from divide-by-zero with NA (no deprecated option_context)
-        qoq = qoq.replace([np.inf, -np.inf], pd.NA)
-        yoy = yoy.replace([np.inf, -np.inf], pd.NA)
-
-        out[f"{c}_qoq"] = qoq
-        out[f"{c}_yoy"] = yoy
-
+    # sort_index returns a new frame, so adding the growth columns below leaves `df` as is
+    out = df.set_axis(_to_datetime(df.index), axis=0, copy=False).sort_index()
+
+    cols = [c for c in cols if c in out.columns]
+    if not cols:
+        return out
+
+    a = out[cols].apply(_to_numeric).ffill().to_numpy(dtype=np.float64)
+    growth = np.full((len(a), len(cols), 2), np.nan)   # [quarter, metric, (qoq, yoy)]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth[1:, :, 0] = a[1:] / a[:-1] - 1.0
+        growth[4:, :, 1] = a[4:] / a[:-4] - 1.0
+    growth[~np.isfinite(growth)] = np.nan
+
+    names = [f"{c}_{kind}" for c in cols for kind in ("qoq", "yoy")]
+    out[names] = growth.reshape(len(a), -1)
     return out
 
 
-def get_quarterly_earnings_json(symbol: str, max_quarters: int = 8) -> Dict[str, Any]:
+def get_quarterly_earnings_json(symbol: str, max_quarters: int = 8,
+                                stock: Optional[yf.Ticker] = None) -> Dict[str, Any]:
     """
     Returns normalized last `max_quarters` (ascending) with QoQ/YoY growth.
     Schema:
@@ -259,53 +498,60 @@ def get_quarterly_earnings_json(symbol: str, max_quarters: int = 8) -> Dict[str,
             "growth": {"revenue":{"qoq":float|null,"yoy":float|null}, ...}}
         ],
       }
+    Pass `stock` to reuse an existing Ticker (and its fetched data) within one run.
     """
-    stock = yf.Ticker(symbol)
+    stock = stock or get_ticker(symbol)
     qdf = extract_quarterly_earnings(stock, max_quarters=max_quarters)
     if qdf.empty:
         return {
             "symbol": symbol,
-            "as_of": datetime.today().strftime("%Y-%m-%d"),
+            "as_of": today_str(),
             "quarters": [],
             "note": "No quarterly statement data available from Yahoo."
         }
 
-    # Ensure numeric
-    for c in ["Revenue", "NetIncome", "EPS_Diluted"]:
-        if c in qdf.columns:
-            qdf[c] = pd.to_numeric(qdf[c], errors="coerce")
-
-    # Add growth columns
+    # Add growth columns (extract_quarterly_earnings already made the metrics numeric)
     qdf = _add_growth_cols(qdf, ["Revenue", "NetIncome", "EPS_Diluted"])
 
     # Keep last N (already done inside extract), ensure ascending order
     qdf = qdf.sort_index()
 
-    quarters = []
-    for dt, row in qdf.iterrows():
-        period = _iso(dt)
-        if period is None:
-            continue
-        quarters.append({
+    # Build the rows column-wise: one object matrix (missing columns → NaN), NaN/NA → None once
+    cols = ["Revenue", "NetIncome", "EPS_Diluted",
+            "Revenue_qoq", "Revenue_yoy", "NetIncome_qoq", "NetIncome_yoy",
+            "EPS_Diluted_qoq", "EPS_Diluted_yoy"]
+    qdf = qdf[qdf.index.notna()]
+    cells = qdf.reindex(columns=cols).to_numpy(dtype=object)
+    cells[pd.isna(cells)] = None
+    periods = qdf.index.strftime("%Y-%m-%d").tolist()
+
+    quarters = [
+        {
             "period": period,
-            "revenue": _to_float(row.get("Revenue")),
-            "net_income": _to_float(row.get("NetIncome")),
-            "eps_diluted": _to_float(row.get("EPS_Diluted")),
+            "revenue": rev,
+            "net_income": ni,
+            "eps_diluted": eps,
             "growth": {
-                "revenue": {"qoq": _to_float(row.get("Revenue_qoq")), "yoy": _to_float(row.get("Revenue_yoy"))},
-                "net_income": {"qoq": _to_float(row.get("NetIncome_qoq")), "yoy": _to_float(row.get("NetIncome_yoy"))},
-                "eps_diluted": {"qoq": _to_float(row.get("EPS_Diluted_qoq")), "yoy": _to_float(row.get("EPS_Diluted_yoy"))},
+                "revenue": {"qoq": rev_q, "yoy": rev_y},
+                "net_income": {"qoq": ni_q, "yoy": ni_y},
+                "eps_diluted": {"qoq": eps_q, "yoy": eps_y},
             }
-        })
+        }
+        for period, (rev, ni, eps, rev_q, rev_y, ni_q, ni_y, eps_q, eps_y) in zip(periods, cells.tolist())
+    ]
 
     return {
         "symbol": symbol,
-        "as_of": datetime.today().strftime("%Y-%m-%d"),
+        "as_of": today_str(),
         "quarters": quarters,
     }
 
 
-def get_insider_transactions_json(symbol: str, last_n: int = 20) -> Dict[str, Any]:
+_INSIDER_RECORD_KEYS = ("date", "filer", "transaction", "ownership", "shares", "price", "value")
+
+
+def get_insider_transactions_json(symbol: str, last_n: int = 20,
+                                  stock: Optional[yf.Ticker] = None) -> Dict[str, Any]:
     """
     Returns normalized insider transactions with a compact summary.
     Schema:
@@ -317,10 +563,11 @@ def get_insider_transactions_json(symbol: str, last_n: int = 20) -> Dict[str, An
         "transactions": [{"date": "...", "filer": str|null, "transaction": str|null, "ownership": str|null,
                           "shares": float|null, "price": float|null, "value": float|null}, ...],
       }
+    Pass `stock` to reuse an existing Ticker (and its fetched data) within one run.
     """
-    stock = yf.Ticker(symbol)
+    stock = stock or get_ticker(symbol)
     ext = extract_insider_transactions(stock, last_n=last_n)
-    as_of = datetime.today().strftime("%Y-%m-%d")
+    as_of = today_str()
 
     if ext is None:
         return {
@@ -332,45 +579,22 @@ def get_insider_transactions_json(symbol: str, last_n: int = 20) -> Dict[str, An
             "note": "No insider transaction table available."
         }
 
+    # normalize_insider_transactions_df_basic already made shares/value numeric and
+    # derived price, so the tail is only read from here on
     df_tail, summary = ext
-    df_tail = df_tail.copy()
-
-    # Normalize numeric fields & compute price if missing
-    if "shares" in df_tail.columns:
-        df_tail["shares"] = pd.to_numeric(df_tail["shares"], errors="coerce")
-    if "value" in df_tail.columns:
-        df_tail["value"] = pd.to_numeric(df_tail["value"], errors="coerce")
-    if "price" not in df_tail.columns:
-        # derive price if possible
-        df_tail["price"] = None
-        try:
-            can = df_tail[["value", "shares"]].dropna()
-            df_tail.loc[can.index, "price"] = can["value"] / can["shares"].replace(0, pd.NA)
-        except Exception:
-            pass
-
-    # Window
-    start = None
-    end = None
-    if "startDate" in df_tail.columns:
-        good_dates = df_tail["startDate"].dropna()
-        if not good_dates.empty:
-            start = _iso(good_dates.min())
-            end = _iso(good_dates.max())
-
-    # Build transactions list
-    cols = df_tail.columns
-    records = []
-    for _, r in df_tail.iterrows():
-        records.append({
-            "date": _iso(r.get("startDate")),
-            "filer": (r.get("filer") if "filer" in cols else None),
-            "transaction": (r.get("transaction") if "transaction" in cols else None),
-            "ownership": (r.get("ownership") if "ownership" in cols else None),
-            "shares": _to_float(r.get("shares")),
-            "price": _to_float(r.get("price")),
-            "value": _to_float(r.get("value")),
-        })
+
+    # Build the transaction records column-wise (as in get_quarterly_earnings_json): dates
+    # formatted in one pass, one object matrix (missing columns → NaN), NaN/NaT → None once
+    dates = _to_datetime(df_tail["startDate"]).dt.strftime("%Y-%m-%d").to_numpy(dtype=object)
+    labels = df_tail.reindex(columns=["filer", "transaction", "ownership"]).to_numpy(dtype=object)
+    amounts = df_tail.reindex(columns=["shares", "price", "value"]).to_numpy(dtype=float)
+    cells = np.concatenate([dates[:, None], labels, amounts.astype(object)], axis=1)
+    cells[pd.isna(cells)] = None
+    records = [dict(zip(_INSIDER_RECORD_KEYS, row)) for row in cells.tolist()]
+
+    # Window: ISO dates order the same as strings, so read it off the formatted column
+    known = [d for d in cells[:, 0] if d is not None]
+    start, end = (min(known), max(known)) if known else (None, None)
 
     # Summary defaults
     by_type = summary.get("by_type_counts", {}) if isinstance(summary, dict) else {}
@@ -391,6 +615,31 @@ def get_insider_transactions_json(symbol: str, last_n: int = 20) -> Dict[str, An
     }
 
 
+def get_symbol_bundle(symbol: str, last_n: int = 15, max_quarters: int = 8) -> Dict[str, Any]:
+    """
+    Everything the analysts read from Yahoo for one symbol:
+      {"ticker": yf.Ticker, "fundamentals": {...}, "insiders": {...}, "quarterly": {...}}
+    The four endpoints behind it (info, price history, quarterly income statement,
+    insider table) are fetched concurrently first, so the JSON builders only read
+    data already loaded on the shared Ticker. Fetch errors resurface from the builders.
+    """
+    stock = get_ticker(symbol)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        wait([
+            pool.submit(get_info, symbol, stock),
+            pool.submit(get_history, symbol, "1y", stock),
+            pool.submit(getattr, stock, "quarterly_income_stmt"),
+            pool.submit(_insider_table, stock),
+        ])
+
+    return {
+        "ticker": stock,
+        "fundamentals": get_fundamentals(symbol, stock=stock),
+        "insiders": get_insider_transactions_json(symbol, last_n=last_n, stock=stock),
+        "quarterly": get_quarterly_earnings_json(symbol, max_quarters=max_quarters, stock=stock),
+    }
+
+
 def _pick_first(colnames, candidates):
     for k in candidates:
         if k in colnames:
@@ -403,24 +652,18 @@ def _normalize_quarterly_df(rawdf: pd.DataFrame) -> pd.DataFrame:
     if rawdf is None or rawdf.empty:
         return pd.DataFrame()
 
-    df = rawdf.copy()
+    df = rawdf
 
     # If metrics are rows and dates are columns, transpose.
-    looks_like_metrics_on_index = False
-    if isinstance(df.index, pd.Index):
-        idx_vals = [str(x) for x in df.index.tolist()[:10]]
-        looks_like_metrics_on_index = any(
-            any(k in s for k in ["Revenue", "Income", "EPS", "Profit"]) for s in idx_vals
-        )
-    if looks_like_metrics_on_index:
+    # One regex search over the first 10 labels (newline-joined, so no match spans two)
+    if _METRIC_LABEL.search("\n".join(map(str, df.index[:10]))):
         df = df.T
 
-    # Index => datetime (quarter end)
-    df.index = pd.to_datetime(df.index, errors="coerce")
-    df = df.sort_index()
-    return df
+    # Index => datetime (quarter end); set_axis returns a new frame, so rawdf keeps its index
+    return df.set_axis(_to_datetime(df.index), axis=0, copy=False).sort_index()
 
 
+@lru_cache(maxsize=4096)
 def _extract_tx_type_from_text(text: str) -> str:
     if not isinstance(text, str):
         return ""
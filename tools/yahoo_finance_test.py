@@ -1,8 +1,14 @@
 import yfinance as yf
+import numpy as np
 import pandas as pd
+import yahoo_finance
+from file_cache import FileCache
 from yahoo_finance import (
+    get_history_many,
     get_quarterly_earnings_json,
     get_insider_transactions_json,
+    _frame_from_json,
+    _frame_to_json,
 )
 
 
@@ -90,6 +96,64 @@ def test_quarterly_and_insiders_json():
         print("\n")
 
 
+def test_history_frame_json_roundtrip():
+    """Test that the on-disk history format restores dtypes, NaNs and the tz-aware index exactly."""
+    idx = pd.date_range("2024-01-02", periods=5, tz="America/New_York", name="Date")
+    hist = pd.DataFrame({
+        "Close": [1.0, np.nan, 3.0, 4.0, 5.0],
+        "Volume": np.arange(5, dtype=np.int64),
+        "Stock Splits": 0.0,
+    }, index=idx)
+    pd.testing.assert_frame_equal(_frame_from_json(_frame_to_json(hist)), hist, check_freq=False)
+
+
+def test_insider_frame_json_roundtrip():
+    """Test that text and datetime columns (NaT included) survive the on-disk format on a RangeIndex."""
+    table = pd.DataFrame({
+        "Shares": np.array([10, 5], dtype=np.int64),
+        "Text": ["Sale at price 1.00 per share.", "Stock Gift"],
+        "Start Date": pd.to_datetime(["2024-03-01", None]),
+    })
+    pd.testing.assert_frame_equal(_frame_from_json(_frame_to_json(table)), table)
+
+
+
+
+def test_undecodable_cache_entry_is_a_miss(tmp_path, monkeypatch):
+    """Test that a history entry the reader can't rebuild (nullable Int64) is treated as a miss."""
+    disk = FileCache("yf/history", root=str(tmp_path))
+    monkeypatch.setattr(yahoo_finance, "_history_cache", {})
+    monkeypatch.setattr(yahoo_finance, "_history_disk", disk)
+    idx = pd.date_range("2024-01-02", periods=2, tz="America/New_York")
+    hist = pd.DataFrame({"Close": [1.0, 2.0], "Volume": pd.array([1, None], dtype="Int64")}, index=idx)
+    disk.set(disk.make_key("X", "1y", yahoo_finance.today_str()), _frame_to_json(hist))
+    assert yahoo_finance._cached_history(("X", "1y")) is None
+
+
+def test_history_many_keeps_each_exchange_timezone(tmp_path, monkeypatch):
+    """Test that a mixed-exchange batch caches each symbol on its own timezone, not the batch's."""
+    ny = pd.DatetimeIndex(["2024-01-03 00:00", "2024-01-04 00:00"], tz="America/New_York")
+    tokyo = pd.DatetimeIndex(["2024-01-04 00:00", "2024-01-05 00:00"], tz="Asia/Tokyo")
+    # What yf.download returns: Tokyo bars converted onto the majority (New York) index
+    idx = ny.union(tokyo.tz_convert("America/New_York"))
+    df = pd.concat({
+        "SPY": pd.DataFrame({"Close": [470.0, np.nan, 468.0, np.nan]}, index=idx),
+        "AAPL": pd.DataFrame({"Close": [184.0, np.nan, 181.0, np.nan]}, index=idx),
+        "7203.T": pd.DataFrame({"Close": [np.nan, 2700.0, np.nan, 2750.0]}, index=idx),
+    }, axis=1)
+    zones = {"SPY": "America/New_York", "AAPL": "America/New_York", "7203.T": "Asia/Tokyo"}
+    monkeypatch.setattr(yahoo_finance.yf, "download", lambda *a, **k: df)
+    monkeypatch.setattr(yahoo_finance, "get_info", lambda symbol: {"exchangeTimezoneName": zones[symbol]})
+    monkeypatch.setattr(yahoo_finance, "_history_cache", {})
+    monkeypatch.setattr(yahoo_finance, "_history_disk", FileCache("yf/history", root=str(tmp_path)))
+
+    hists = get_history_many(["SPY", "AAPL", "7203.T"], period="tz-test")
+    assert hists["7203.T"].index.equals(tokyo)
+    assert hists["SPY"].index.equals(ny)
+    prices = yahoo_finance.get_historical_prices("7203.T", period="tz-test")
+    assert (prices["start_date"], prices["end_date"]) == ("2024-01-04", "2024-01-05")
+
+
 def debug_print_raw_insider_transactions(tickers=["PLTR"], max_rows=8):
     for symbol in tickers:
         print("=" * 70)